@@ -0,0 +1,147 @@
+######################################################################
+# Copyright (C) 2025 ETH Zurich
+# BitePy: A Python Battery Intraday Trading Engine
+# Bits to Energy Lab - Chair of Information Management - ETH Zurich
+#
+# Author: David Schaurecker
+#
+# Licensed under MIT License, see https://opensource.org/license/mit
+######################################################################
+
+import os
+import shutil
+import tempfile
+import time
+
+import bitepy as bp
+
+from .common import ORDER_COUNTS, write_csv_days, write_raw_epex_days
+
+
+class ParseMarketData:
+    """Data.parse_market_data on two synthetic raw EPEX days."""
+    params = ORDER_COUNTS
+    param_names = ["orders_per_day"]
+    number = 1
+    repeat = 3
+    timeout = 600
+
+    def setup_cache(self):
+        paths = {}
+        for num_orders in ORDER_COUNTS:
+            raw_path = os.path.abspath(f"raw_{num_orders}")
+            write_raw_epex_days(raw_path, num_days=2, num_orders=num_orders)
+            paths[num_orders] = raw_path
+        return paths
+
+    def setup(self, paths, num_orders):
+        self.raw_path = paths[num_orders]
+        self.save_path = tempfile.mkdtemp() + "/"
+
+    def teardown(self, paths, num_orders):
+        shutil.rmtree(self.save_path, ignore_errors=True)
+
+    def time_parse_market_data(self, paths, num_orders):
+        bp.Data().parse_market_data("2021-01-01", "2021-01-02", self.raw_path, self.save_path, verbose=False)
+
+    def peakmem_parse_market_data(self, paths, num_orders):
+        bp.Data().parse_market_data("2021-01-01", "2021-01-02", self.raw_path, self.save_path, verbose=False)
+
+    def time_parse_market_data_streaming(self, paths, num_orders):
+        bp.Data().parse_market_data("2021-01-01", "2021-01-02", self.raw_path, self.save_path, verbose=False,
+                                    max_memory_mb=16)
+
+    def peakmem_parse_market_data_streaming(self, paths, num_orders):
+        bp.Data().parse_market_data("2021-01-01", "2021-01-02", self.raw_path, self.save_path, verbose=False,
+                                    max_memory_mb=16)
+
+    def track_parse_orders_per_second(self, paths, num_orders):
+        start = time.perf_counter()
+        bp.Data().parse_market_data("2021-01-01", "2021-01-02", self.raw_path, self.save_path, verbose=False)
+        return 2 * num_orders / (time.perf_counter() - start)
+    track_parse_orders_per_second.unit = "orders/s"
+
+
+class CreateBinsFromCSV:
+    """Data.create_bins_from_csv on two synthetic pre-processed days."""
+    params = ORDER_COUNTS
+    param_names = ["orders_per_day"]
+    number = 1
+    repeat = 3
+    timeout = 600
+
+    def setup_cache(self):
+        csv_lists = {}
+        for num_orders in ORDER_COUNTS:
+            csv_lists[num_orders] = write_csv_days(os.path.abspath(f"csv_{num_orders}"), num_days=2, num_orders=num_orders)
+        return csv_lists
+
+    def setup(self, csv_lists, num_orders):
+        self.csv_list = csv_lists[num_orders]
+        self.save_path = tempfile.mkdtemp()
+
+    def teardown(self, csv_lists, num_orders):
+        shutil.rmtree(self.save_path, ignore_errors=True)
+
+    def time_create_bins_from_csv(self, csv_lists, num_orders):
+        bp.Data().create_bins_from_csv(self.csv_list, self.save_path, verbose=False)
+
+    def time_create_bins_from_csv_two_workers(self, csv_lists, num_orders):
+        bp.Data().create_bins_from_csv(self.csv_list, self.save_path, verbose=False, workers=2)
+
+    def peakmem_create_bins_from_csv(self, csv_lists, num_orders):
+        bp.Data().create_bins_from_csv(self.csv_list, self.save_path, verbose=False)
+
+    def track_create_bins_orders_per_second(self, csv_lists, num_orders):
+        start = time.perf_counter()
+        bp.Data().create_bins_from_csv(self.csv_list, self.save_path, verbose=False)
+        return len(self.csv_list) * num_orders / (time.perf_counter() - start)
+    track_create_bins_orders_per_second.unit = "orders/s"
+
+
+class CreateSyntheticBins:
+    """Data.create_synthetic_bins for one day of generated order flow."""
+    params = ORDER_COUNTS
+    param_names = ["orders_per_day"]
+    number = 1
+    repeat = 3
+    timeout = 600
+
+    def setup(self, num_orders):
+        self.save_path = tempfile.mkdtemp()
+
+    def teardown(self, num_orders):
+        shutil.rmtree(self.save_path, ignore_errors=True)
+
+    def time_create_synthetic_bins(self, num_orders):
+        bp.Data().create_synthetic_bins("2021-01-01", "2021-01-01", self.save_path, orders_per_day=num_orders, verbose=False)
+
+    def track_synthetic_orders_per_second(self, num_orders):
+        start = time.perf_counter()
+        bp.Data().create_synthetic_bins("2021-01-01", "2021-01-01", self.save_path, orders_per_day=num_orders, verbose=False)
+        return num_orders / (time.perf_counter() - start)
+    track_synthetic_orders_per_second.unit = "orders/s"
+
+
+class CreateSyntheticBinsAtScale:
+    """Data.create_synthetic_bins at backtest scale, tracked as minutes per 100 million orders."""
+    params = [1_000_000, 5_000_000]
+    param_names = ["orders_per_day"]
+    number = 1
+    repeat = 2
+    timeout = 1800
+
+    def setup(self, num_orders):
+        self.save_path = tempfile.mkdtemp()
+
+    def teardown(self, num_orders):
+        shutil.rmtree(self.save_path, ignore_errors=True)
+
+    def peakmem_create_synthetic_bins(self, num_orders):
+        bp.Data().create_synthetic_bins("2021-01-01", "2021-01-01", self.save_path, orders_per_day=num_orders, verbose=False)
+
+    def track_minutes_per_100m_orders(self, num_orders):
+        start = time.perf_counter()
+        bp.Data().create_synthetic_bins("2021-01-01", "2021-01-01", self.save_path, orders_per_day=num_orders, verbose=False)
+        return (time.perf_counter() - start) / 60 * 100_000_000 / num_orders
+    track_minutes_per_100m_orders.unit = "min"
@@ -0,0 +1,30 @@
+######################################################################
+# Copyright (C) 2025 ETH Zurich
+# BitePy: A Python Battery Intraday Trading Engine
+# Bits to Energy Lab - Chair of Information Management - ETH Zurich
+#
+# Author: David Schaurecker
+#
+# Licensed under MIT License, see https://opensource.org/license/mit
+######################################################################
+
+import subprocess
+import sys
+
+
+class Import:
+    """Startup cost of headless workers, each measured in a fresh interpreter."""
+    number = 1
+    repeat = 10
+
+    def timeraw_import_bitepy(self):
+        return "import bitepy"
+
+    def timeraw_import_bitepy_and_pyplot(self):
+        # reference point: what every worker paid before plotting was loaded lazily
+        return "import bitepy; import matplotlib.pyplot"
+
+    def track_modules_loaded_by_import(self):
+        code = "import sys; before = len(sys.modules); import bitepy; print(len(sys.modules) - before)"
+        return int(subprocess.check_output([sys.executable, "-c", code]).decode().strip())
+    track_modules_loaded_by_import.unit = "modules"
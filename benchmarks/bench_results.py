@@ -0,0 +1,55 @@
+######################################################################
+# Copyright (C) 2025 ETH Zurich
+# BitePy: A Python Battery Intraday Trading Engine
+# Bits to Energy Lab - Chair of Information Management - ETH Zurich
+#
+# Author: David Schaurecker
+#
+# Licensed under MIT License, see https://opensource.org/license/mit
+######################################################################
+
+import copy
+import os
+
+# plots are rendered off-screen, plt.show() is a no-op on the Agg backend
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import bitepy as bp
+
+from .common import ORDER_COUNTS, simulation_window, write_bin_days
+
+# the heatmap drops the last day, so a few days are needed for a meaningful plot
+NUM_DAYS = 4
+
+
+class ResultsPlots:
+    """Results plotting on the logs of a multi-day synthetic simulation."""
+    number = 1
+    repeat = 3
+    timeout = 1800
+
+    def setup_cache(self):
+        bin_path = write_bin_days(os.path.abspath("results"), num_days=NUM_DAYS, num_orders=ORDER_COUNTS[0])
+        start, end = simulation_window(NUM_DAYS - 1)
+        sim = bp.Simulation(start, end, solve_frequency=1.0)
+        sim.run(bin_path, verbose=False)
+        return sim.get_logs()
+
+    def setup(self, logs):
+        self.results = bp.Results(copy.deepcopy(logs))
+
+    def teardown(self, logs):
+        import matplotlib.pyplot as plt
+        plt.close("all")
+
+    def time_get_total_reward(self, logs):
+        self.results.get_total_reward()
+
+    def time_plot_decision_chart(self, logs):
+        self.results.plot_decision_chart(0, -1)
+
+    def time_plot_heatmap(self, logs):
+        self.results.plot_heatmap()
+
+    def peakmem_plot_heatmap(self, logs):
+        self.results.plot_heatmap()
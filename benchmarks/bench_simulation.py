@@ -0,0 +1,270 @@
+######################################################################
+# Copyright (C) 2025 ETH Zurich
+# BitePy: A Python Battery Intraday Trading Engine
+# Bits to Energy Lab - Chair of Information Management - ETH Zurich
+#
+# Author: David Schaurecker
+#
+# Licensed under MIT License, see https://opensource.org/license/mit
+######################################################################
+
+import os
+import time
+
+import numpy as np
+
+import bitepy as bp
+
+from .common import ORDER_COUNTS, first_bin, simulation_window, write_bin_days, write_csv_days
+
+# a one-day simulation window reads the file of its end date as well
+NUM_DAYS = 2
+
+
+def _write_bins(num_orders):
+    return write_bin_days(os.path.abspath(f"sim_{num_orders}"), num_days=NUM_DAYS, num_orders=num_orders)
+
+
+class AddBinToOrderqueue:
+    """Simulation.add_bin_to_orderqueue for a single synthetic day."""
+    params = ORDER_COUNTS
+    param_names = ["orders_per_day"]
+    number = 1
+    repeat = 5
+    timeout = 600
+
+    def setup_cache(self):
+        return {num_orders: _write_bins(num_orders) for num_orders in ORDER_COUNTS}
+
+    def setup(self, bin_paths, num_orders):
+        start, end = simulation_window(1)
+        self.sim = bp.Simulation(start, end)
+        self.path = first_bin(bin_paths[num_orders])
+
+    def time_add_bin_to_orderqueue(self, bin_paths, num_orders):
+        self.sim.add_bin_to_orderqueue(self.path)
+
+    def peakmem_add_bin_to_orderqueue(self, bin_paths, num_orders):
+        self.sim.add_bin_to_orderqueue(self.path)
+
+    def track_add_bin_orders_per_second(self, bin_paths, num_orders):
+        start = time.perf_counter()
+        self.sim.add_bin_to_orderqueue(self.path)
+        return num_orders / (time.perf_counter() - start)
+    track_add_bin_orders_per_second.unit = "orders/s"
+
+
+class CompressedBins:
+    """Size and loading speed of block-compressed order files against engine binaries ("none")."""
+    params = ([ORDER_COUNTS[-1]], ["none", "lz4", "zstd", "zlib"])
+    param_names = ["orders_per_day", "compression"]
+    number = 1
+    repeat = 5
+    timeout = 600
+
+    def setup_cache(self):
+        bin_paths = {}
+        for codec in self.params[1]:
+            try:
+                bin_paths[codec] = write_bin_days(os.path.abspath(f"zbin_{codec}"), num_days=1, num_orders=ORDER_COUNTS[-1],
+                                                  compression=None if codec == "none" else codec)
+            except ImportError:
+                bin_paths[codec] = None
+        return bin_paths
+
+    def setup(self, bin_paths, num_orders, compression):
+        if bin_paths[compression] is None:
+            raise NotImplementedError(f"{compression} is not installed")
+        start, end = simulation_window(1)
+        self.sim = bp.Simulation(start, end)
+        self.path = first_bin(bin_paths[compression])
+
+    def time_add_bin_to_orderqueue(self, bin_paths, num_orders, compression):
+        self.sim.add_bin_to_orderqueue(self.path)
+
+    def track_bytes_per_order(self, bin_paths, num_orders, compression):
+        catalog = bp.Catalog.load(bin_paths[compression])
+        return sum(entry["size"] for entry in catalog.files.values() if not entry.get("segments")) / num_orders
+    track_bytes_per_order.unit = "bytes"
+
+
+class RunOneDay:
+    """Simulation.run_one_day over one synthetic day for several DP settings."""
+    params = ([ORDER_COUNTS[0]], [11, 51], [0.0, 1.0])
+    param_names = ["orders_per_day", "num_stor_states", "solve_frequency"]
+    number = 1
+    repeat = 3
+    timeout = 1200
+
+    def setup_cache(self):
+        return {num_orders: _write_bins(num_orders) for num_orders in ORDER_COUNTS[:1]}
+
+    def setup(self, bin_paths, num_orders, num_stor_states, solve_frequency):
+        start, end = simulation_window(1)
+        self.sim = bp.Simulation(start, end, num_stor_states=num_stor_states, solve_frequency=solve_frequency)
+        self.sim.add_bin_to_orderqueue(first_bin(bin_paths[num_orders]))
+
+    def time_run_one_day(self, bin_paths, num_orders, num_stor_states, solve_frequency):
+        self.sim.run_one_day(True)
+
+    def peakmem_run_one_day(self, bin_paths, num_orders, num_stor_states, solve_frequency):
+        self.sim.run_one_day(True)
+
+    def track_run_orders_per_second(self, bin_paths, num_orders, num_stor_states, solve_frequency):
+        start = time.perf_counter()
+        self.sim.run_one_day(True)
+        return num_orders / (time.perf_counter() - start)
+    track_run_orders_per_second.unit = "orders/s"
+
+    def track_total_reward(self, bin_paths, num_orders, num_stor_states, solve_frequency):
+        # not a timing, but guards against "speedups" that silently change the results
+        self.sim.run_one_day(True)
+        return self.sim._sim_cpp.returnReward()
+    track_total_reward.unit = "EUR"
+
+
+class OrderStreamReplay:
+    """OrderStream.replay of one synthetic day, pushed in batches of several sizes."""
+    params = ([ORDER_COUNTS[0]], [10, 100, 1000])
+    param_names = ["orders_per_day", "batch_orders"]
+    number = 1
+    repeat = 1
+    timeout = 1200
+
+    def setup_cache(self):
+        return {num_orders: write_csv_days(os.path.abspath(f"stream_{num_orders}"), num_days=1, num_orders=num_orders)[0]
+                for num_orders in ORDER_COUNTS[:1]}
+
+    def setup(self, csv_paths, num_orders, batch_orders):
+        start, end = simulation_window(1)
+        self.stream = bp.Simulation(start, end).open_stream()
+        for _ in self.stream.replay(csv_paths[num_orders], batch_orders=batch_orders):
+            pass
+        self.summary = self.stream.get_latency_summary()
+
+    def track_push_p50_ms(self, csv_paths, num_orders, batch_orders):
+        return self.summary["total_p50_ms"]
+    track_push_p50_ms.unit = "ms"
+
+    def track_push_p99_ms(self, csv_paths, num_orders, batch_orders):
+        return self.summary["total_p99_ms"]
+    track_push_p99_ms.unit = "ms"
+
+    def track_stream_orders_per_second(self, csv_paths, num_orders, batch_orders):
+        return num_orders / (self.stream.get_latencies()["total_ms"].sum() / 1000.)
+    track_stream_orders_per_second.unit = "orders/s"
+
+
+class Run:
+    """Simulation.run end-to-end over the synthetic data directory."""
+    params = ([ORDER_COUNTS[0]], [11, 51], [0.0, 1.0])
+    param_names = ["orders_per_day", "num_stor_states", "solve_frequency"]
+    number = 1
+    repeat = 3
+    timeout = 1200
+
+    def setup_cache(self):
+        return {num_orders: _write_bins(num_orders) for num_orders in ORDER_COUNTS[:1]}
+
+    def setup(self, bin_paths, num_orders, num_stor_states, solve_frequency):
+        start, end = simulation_window(1)
+        self.sim = bp.Simulation(start, end, num_stor_states=num_stor_states, solve_frequency=solve_frequency)
+        self.bin_path = bin_paths[num_orders]
+
+    def time_run(self, bin_paths, num_orders, num_stor_states, solve_frequency):
+        self.sim.run(self.bin_path, verbose=False)
+
+    def peakmem_run(self, bin_paths, num_orders, num_stor_states, solve_frequency):
+        self.sim.run(self.bin_path, verbose=False)
+
+
+class RunParallel:
+    """Simulation.run_parallel against the sequential run on a multi-day period."""
+    params = ([ORDER_COUNTS[0]], [1, 2])
+    param_names = ["orders_per_day", "chunk_days"]
+    number = 1
+    repeat = 1
+    timeout = 2400
+    num_days = 6
+
+    def setup_cache(self):
+        return {num_orders: write_bin_days(os.path.abspath(f"sim_parallel_{num_orders}"), num_days=self.num_days + 1,
+                                           num_orders=num_orders)
+                for num_orders in ORDER_COUNTS[:1]}
+
+    def setup(self, bin_paths, num_orders, chunk_days):
+        start, end = simulation_window(self.num_days)
+        self.sim = bp.Simulation(start, end)
+        self.bin_path = bin_paths[num_orders]
+
+    def time_run_parallel(self, bin_paths, num_orders, chunk_days):
+        self.sim.run_parallel(self.bin_path, chunk_days=chunk_days, verbose=False)
+
+    def track_reward_gap(self, bin_paths, num_orders, chunk_days):
+        report = self.sim.run_parallel(self.bin_path, chunk_days=chunk_days, compare_sequential=True, verbose=False)
+        return report["reward_gap"]
+
+    def track_max_stitching_gap(self, bin_paths, num_orders, chunk_days):
+        report = self.sim.run_parallel(self.bin_path, chunk_days=chunk_days, verbose=False)
+        return float(report["chunks"]["stitching_gap"].max())
+
+
+class GetLogs:
+    """Simulation.get_logs after a finished one-day run."""
+    params = ORDER_COUNTS
+    param_names = ["orders_per_day"]
+    number = 1
+    repeat = 5
+    timeout = 1200
+
+    def setup_cache(self):
+        return {num_orders: _write_bins(num_orders) for num_orders in ORDER_COUNTS}
+
+    def setup(self, bin_paths, num_orders):
+        start, end = simulation_window(1)
+        self.sim = bp.Simulation(start, end)
+        self.sim.add_bin_to_orderqueue(first_bin(bin_paths[num_orders]))
+        self.sim.run_one_day(True)
+
+    def time_get_logs(self, bin_paths, num_orders):
+        self.sim.get_logs()
+
+    def peakmem_get_logs(self, bin_paths, num_orders):
+        self.sim.get_logs()
+
+
+class ReturnVolPricePairs:
+    """Simulation.return_vol_price_pairs (market-only replay) for one synthetic day."""
+    params = (ORDER_COUNTS, [10, 60])
+    param_names = ["orders_per_day", "frequency"]
+    number = 1
+    repeat = 3
+    timeout = 1200
+
+    volumes = np.array([-10, -5, -1, 0, 1, 5, 10])
+
+    def setup_cache(self):
+        return {num_orders: _write_bins(num_orders) for num_orders in ORDER_COUNTS}
+
+    def setup(self, bin_paths, num_orders, frequency):
+        start, end = simulation_window(1)
+        self.sim = bp.Simulation(start, end)
+        self.sim.add_bin_to_orderqueue(first_bin(bin_paths[num_orders]))
+
+    def time_return_vol_price_pairs(self, bin_paths, num_orders, frequency):
+        self.sim.return_vol_price_pairs(True, frequency, self.volumes)
+
+    def peakmem_return_vol_price_pairs(self, bin_paths, num_orders, frequency):
+        self.sim.return_vol_price_pairs(True, frequency, self.volumes)
+
+    def time_return_depth_tensor(self, bin_paths, num_orders, frequency):
+        self.sim.return_depth_tensor(True, frequency, self.volumes)
+
+    def peakmem_return_depth_tensor(self, bin_paths, num_orders, frequency):
+        self.sim.return_depth_tensor(True, frequency, self.volumes)
+
+    def track_vol_price_orders_per_second(self, bin_paths, num_orders, frequency):
+        start = time.perf_counter()
+        self.sim.return_vol_price_pairs(True, frequency, self.volumes)
+        return num_orders / (time.perf_counter() - start)
+    track_vol_price_orders_per_second.unit = "orders/s"
@@ -0,0 +1,148 @@
+######################################################################
+# Copyright (C) 2025 ETH Zurich
+# BitePy: A Python Battery Intraday Trading Engine
+# Bits to Energy Lab - Chair of Information Management - ETH Zurich
+#
+# Author: David Schaurecker
+#
+# Licensed under MIT License, see https://opensource.org/license/mit
+######################################################################
+
+"""
+Deterministic synthetic order data shared by all benchmarks.
+
+EPEX market data is licensed and can not be used in CI, so every benchmark runs
+on order books generated from a fixed seed. The same seed and size always produce
+byte-identical files, which keeps the results comparable across commits.
+"""
+
+import os
+from zipfile import ZipFile, ZIP_DEFLATED
+
+import numpy as np
+import pandas as pd
+
+SEED = 42
+START_DAY = pd.Timestamp("2021-01-01", tz="UTC")
+
+# orders per simulated day for the "small" and "large" parameter points
+ORDER_COUNTS = [20_000, 100_000]
+
+
+def synthetic_orders(day: pd.Timestamp, num_orders: int, seed: int = SEED):
+    """
+    Generate one day of pre-processed orders, as written by Data.parse_market_data.
+
+    Returns:
+        pd.DataFrame: Orders with the columns id, initial, side, start, transaction, validity,
+        price and quantity, sorted by transaction time. Timestamps are ISO 8601 strings in UTC.
+    """
+    import bitepy as bp
+
+    return bp.Data().generate_synthetic_orders(str(day.date()), orders_per_day=num_orders, seed=seed)
+
+
+def write_csv_days(path: str, num_days: int, num_orders: int):
+    """
+    Write num_days zipped CSV files in the format of Data.parse_market_data.
+
+    Returns:
+        list: The paths of the written files, sorted by date.
+    """
+    os.makedirs(path, exist_ok=True)
+    paths = []
+    for i in range(num_days):
+        day = START_DAY + pd.Timedelta(days=i)
+        filename = f"orderbook_{day.date()}.csv"
+        df = synthetic_orders(day, num_orders).set_index("id")
+        df.index.name = None
+        compression_options = dict(method="zip", archive_name=filename)
+        df.to_csv(os.path.join(path, filename + ".zip"), compression=compression_options)
+        paths.append(os.path.join(path, filename + ".zip"))
+    return paths
+
+
+def write_bin_days(path: str, num_days: int, num_orders: int, compression: str = None):
+    """
+    Write num_days order binaries (orderbook_YYYY-MM-DD.bin) with Data.create_synthetic_bins.
+
+    With compression, block-compressed files (orderbook_YYYY-MM-DD.zbin) are written instead.
+
+    Returns:
+        str: The directory containing the binaries, as expected by Simulation.run.
+    """
+    import bitepy as bp
+
+    end_day = START_DAY + pd.Timedelta(days=num_days - 1)
+    bp.Data().create_synthetic_bins(str(START_DAY.date()), str(end_day.date()), path,
+                                    orders_per_day=num_orders, seed=SEED, verbose=False, compression=compression)
+    return path
+
+
+def first_bin(bin_path: str):
+    """Return the path of the first synthetic day's binary in bin_path."""
+    return os.path.join(bin_path, f"orderbook_{START_DAY.date()}.bin")
+
+
+def write_raw_epex_days(path: str, num_days: int, num_orders: int):
+    """
+    Write num_days raw EPEX order files in the 2021 format read by Data._read_id_table_2021.
+
+    Every order is added once and roughly a third of them is later changed or deleted,
+    so the change and cancel message handling of the parser is exercised as well.
+    """
+    header = ["TransactionTime", "OrderId", "InitialId", "ParentId", "Side", "Product",
+              "DeliveryStart", "DeliveryEnd", "DeliveryArea", "ExecutionRestriction", "UserDefinedBlock",
+              "LinkedBasketId", "RevisionNo", "ActionCode", "CreationTime", "Price", "Currency",
+              "Quantity", "QuantityUnit", "Volume", "VolumeUnit", "ValidityTime"]
+    for i in range(num_days):
+        day = START_DAY + pd.Timedelta(days=i)
+        rng = np.random.RandomState(SEED + day.dayofyear)
+        orders = synthetic_orders(day, num_orders)
+
+        n_changed = num_orders // 3
+        changed = np.sort(rng.choice(num_orders, size=n_changed, replace=False))
+        followup = orders.iloc[changed].copy()
+        tr = pd.to_datetime(orders["transaction"].iloc[changed].to_numpy())
+        va = pd.to_datetime(orders["validity"].iloc[changed].to_numpy())
+        followup["transaction"] = (tr + (va - tr) / 2).strftime("%Y-%m-%dT%H:%M:%S.%f").str[:-3] + "Z"
+        followup["action"] = np.where(rng.rand(n_changed) < 0.5, "C", "D")
+        followup["price"] = np.round(followup["price"] + rng.normal(scale=0.5, size=n_changed), 2)
+
+        raw = pd.concat([orders.assign(action="A"), followup]).sort_values("transaction", kind="stable")
+        n = len(raw)
+        out = pd.DataFrame({
+            "TransactionTime": raw["transaction"].to_numpy(),
+            "OrderId": raw["id"].to_numpy(),
+            "InitialId": raw["initial"].to_numpy(),
+            "ParentId": "",
+            "Side": raw["side"].to_numpy(),
+            "Product": "XBID_Hour_Power",
+            "DeliveryStart": raw["start"].to_numpy(),
+            "DeliveryEnd": raw["start"].to_numpy(),
+            "DeliveryArea": "10YDE-RWENET---I",
+            "ExecutionRestriction": "NON",
+            "UserDefinedBlock": "N",
+            "LinkedBasketId": "",
+            "RevisionNo": np.ones(n, dtype=np.int64),
+            "ActionCode": raw["action"].to_numpy(),
+            "CreationTime": raw["transaction"].to_numpy(),
+            "Price": raw["price"].to_numpy(),
+            "Currency": "EUR",
+            "Quantity": raw["quantity"].to_numpy(),
+            "QuantityUnit": "MW",
+            "Volume": raw["quantity"].to_numpy(),
+            "VolumeUnit": "MWh",
+            "ValidityTime": raw["validity"].str[:19].to_numpy() + "Z",
+        }, columns=header)
+
+        folder = os.path.join(path, day.strftime("%Y"), day.strftime("%m"))
+        os.makedirs(folder, exist_ok=True)
+        csv_name = f"Continuous_Orders-DE-{day.strftime('%Y%m%d')}.csv"
+        with ZipFile(os.path.join(folder, csv_name + ".zip"), "w", compression=ZIP_DEFLATED) as zf:
+            zf.writestr(csv_name, "# synthetic EPEX order data\n" + out.to_csv(index=False))
+
+
+def simulation_window(num_days: int):
+    """Return the (start, end) timestamps of a simulation covering num_days synthetic days."""
+    return START_DAY, START_DAY + pd.Timedelta(days=num_days)
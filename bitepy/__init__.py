@@ -13,9 +13,13 @@ from importlib.metadata import version
 from .simulation import Simulation
 from .data import Data
 from .results import Results
+from .catalog import Catalog
+from .jobqueue import JobQueue
+from .latency import SolveLatencyModel
+from .streaming import OrderStream
 
 
-__all__ = ["Simulation", "Data", "Results"]
+__all__ = ["Simulation", "Data", "Results", "Catalog", "JobQueue", "SolveLatencyModel", "OrderStream"]
 
 __version__ = version("bitepy")
 
@@ -29,4 +33,8 @@ Classes:
     Simulation: Core simulation class to run and manage simulations.
     Data: Data class to manage input data for simulations.
     Results: Results class to manage simulation results.
+    Catalog: Catalog of the order binaries in a data directory.
+    JobQueue: Filesystem job queue to distribute simulation runs across processes and hosts.
+    SolveLatencyModel: Calibrated model to replay realistic DP solve times deterministically.
+    OrderStream: Push-based order feed that returns the battery's decisions per batch.
 """
\ No newline at end of file
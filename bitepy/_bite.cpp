@@ -10,9 +10,20 @@
 
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>          // for automatic conversion of STL containers
-// #include <pybind11/numpy.h>        // if you need NumPy arrays
+#include <pybind11/numpy.h>        // for NumPy array exports
 #include <pybind11/chrono.h>       // if you need chrono conversions
 
+#include <algorithm>
+#include <cstdint>
+#include <iterator>
+#include <limits>
+#include <set>
+#include <stdexcept>
+#include <string>
+#include <tuple>
+#include <type_traits>
+#include <vector>
+
 #include "Simulation.h"
 
 namespace py = pybind11;
@@ -20,6 +31,104 @@ namespace py = pybind11;
 using simParams = SimulationParameters;
 using sim = Simulation;
 
+// executed and killed orders share one record layout, converted here for getLogs and getExecutedOrdersFrom
+const auto execOrderToDict = [](const auto &record) {
+    py::dict pyRecord;
+    pyRecord["dp_run"] = record.dpRun;
+    pyRecord["time"] = ExecMarketOrder::epochToDateTimeMS(record.time);
+    pyRecord["last_solve_time"] = ExecMarketOrder::epochToDateTimeMS(record.lastSolveTime);
+    pyRecord["hour"] = ExecMarketOrder::epochToDateTime(record.hour);
+    pyRecord["reward"] = record.reward / 1000.0;
+    pyRecord["reward_incl_deg_costs"] = record.rewardInclDegCosts / 1000.0;
+    pyRecord["volume"] = record.volume / 10.0;
+    pyRecord["type"] = record.type == LimitOrder::Type::Buy ? "Buy" : "Sell";
+    pyRecord["final_pos"] = record.finalPos / 10.0;
+    pyRecord["final_stor"] = record.finalStor / 10.0;
+    // pyRecord["prae_final_pos"] = record.praeFinalPos / 10.0;
+    // pyRecord["prae_final_stor"] = record.praeFinalStor / 10.0;
+    // pyRecord["prae_init_storage"] = record.praeInitStorage / 10.0;
+    return pyRecord;
+};
+
+// argument types of a member function, so NumPy columns are converted to the column types of the engine's writer
+template <typename T> struct MemberArgs;
+template <typename C, typename R, typename... A> struct MemberArgs<R (C::*)(A...)> {
+    using type = std::tuple<std::decay_t<A>...>;
+};
+template <typename C, typename R, typename... A> struct MemberArgs<R (C::*)(A...) const> : MemberArgs<R (C::*)(A...)> {};
+
+// column i (0: ids, ..., 7: quantities) of writeOrderBinFromPandas, whose first argument is the file path
+template <size_t i>
+using WriterColumn = std::tuple_element_t<i + 1, MemberArgs<decltype(&sim::writeOrderBinFromPandas)>::type>;
+
+// epoch milliseconds to the ISO 8601 UTC strings of the order files, with seconds (starts) or milliseconds
+inline std::string epochMsToIso(int64_t epochMs, bool withMs) {
+    int64_t days = (epochMs >= 0 ? epochMs : epochMs - 86399999) / 86400000;
+    const int64_t msOfDay = epochMs - days * 86400000;
+    // civil date from the days since 1970-01-01 (H. Hinnant's days_from_civil inverse)
+    days += 719468;
+    const int64_t era = (days >= 0 ? days : days - 146096) / 146097;
+    const int64_t dayOfEra = days - era * 146097;
+    const int64_t yearOfEra = (dayOfEra - dayOfEra / 1460 + dayOfEra / 36524 - dayOfEra / 146096) / 365;
+    const int64_t dayOfYear = dayOfEra - (365 * yearOfEra + yearOfEra / 4 - yearOfEra / 100);
+    const int64_t mp = (5 * dayOfYear + 2) / 153;
+    const int64_t day = dayOfYear - (153 * mp + 2) / 5 + 1;
+    const int64_t month = mp < 10 ? mp + 3 : mp - 9;
+    const int64_t year = yearOfEra + era * 400 + (month <= 2);
+    // digits are written directly, snprintf would dominate the conversion of large columns
+    char buffer[] = "0000-00-00T00:00:00.000Z";
+    const auto put = [&buffer](size_t pos, int64_t value, int width) {
+        for (int i = width - 1; i >= 0; --i, value /= 10) {
+            buffer[pos + i] = static_cast<char>('0' + value % 10);
+        }
+    };
+    put(0, year, 4);
+    put(5, month, 2);
+    put(8, day, 2);
+    put(11, msOfDay / 3600000, 2);
+    put(14, msOfDay / 60000 % 60, 2);
+    put(17, msOfDay / 1000 % 60, 2);
+    if (!withMs) {
+        buffer[19] = 'Z';
+        return std::string(buffer, 20);
+    }
+    put(20, msOfDay % 1000, 3);
+    return std::string(buffer, 24);
+}
+
+template <typename Column, typename T>
+Column numericColumn(const T *values, size_t n) {
+    static_assert(std::is_arithmetic<typename Column::value_type>::value, "the writer must take a numeric column");
+    Column column;
+    column.reserve(n);
+    for (size_t i = 0; i < n; ++i) {
+        column.push_back(static_cast<typename Column::value_type>(values[i]));
+    }
+    return column;
+}
+
+template <typename Column>
+Column timeColumn(const int64_t *epochMs, size_t n, bool withMs) {
+    static_assert(std::is_same<typename Column::value_type, std::string>::value, "the writer must take ISO 8601 strings");
+    Column column;
+    column.reserve(n);
+    for (size_t i = 0; i < n; ++i) {
+        column.push_back(epochMsToIso(epochMs[i], withMs));
+    }
+    return column;
+}
+
+template <typename Column>
+Column sideColumn(const bool *isBuy, size_t n) {
+    static_assert(std::is_same<typename Column::value_type, std::string>::value, "the writer must take side strings");
+    Column column;
+    column.reserve(n);
+    for (size_t i = 0; i < n; ++i) {
+        column.push_back(isBuy[i] ? "BUY" : "SELL");
+    }
+    return column;
+}
+
 PYBIND11_MODULE(_bite, m) {
     m.doc() = "pybind11 wrapper for the Simulation C++ code";
     // Params class
@@ -137,14 +246,59 @@ PYBIND11_MODULE(_bite, m) {
                       [](sim &self) -> simParams& { return self.params; },  // getter
                       [](sim &self, simParams &new_params) { self.params = new_params; }) // setter
         // method to run
+        // the engine does not touch Python objects, so the GIL is released while it works
+        // and Python threads (e.g. progress monitors) keep running
         .def("run",
             &sim::run,
             py::arg("isLastDataset"),
+            py::call_guard<py::gil_scoped_release>(),
             "Run the simulation. 'isLast' indicates if this is the final run.")
 
         .def("addOrderQueueFromPandas", &sim::addOrderQueueFromPandas)
-        .def("addOrderQueueFromBin", &sim::addOrderQueueFromBin)
+        .def("addOrderQueueFromBin", &sim::addOrderQueueFromBin, py::call_guard<py::gil_scoped_release>())
         .def("writeOrderBinFromPandas", &sim::writeOrderBinFromPandas)
+        // NumPy counterpart of writeOrderBinFromPandas: the columns are read from the array buffers and converted
+        // (timestamps from epoch milliseconds) with the GIL released, without creating a Python object per order
+        .def("writeOrderBinFromArrays", [](sim &self, const std::string &path,
+                                           py::array_t<int64_t, py::array::c_style | py::array::forcecast> ids,
+                                           py::array_t<int64_t, py::array::c_style | py::array::forcecast> initials,
+                                           py::array_t<bool, py::array::c_style | py::array::forcecast> isBuy,
+                                           py::array_t<int64_t, py::array::c_style | py::array::forcecast> starts,
+                                           py::array_t<int64_t, py::array::c_style | py::array::forcecast> transactions,
+                                           py::array_t<int64_t, py::array::c_style | py::array::forcecast> validities,
+                                           py::array_t<double, py::array::c_style | py::array::forcecast> prices,
+                                           py::array_t<double, py::array::c_style | py::array::forcecast> quantities) {
+                const size_t n = static_cast<size_t>(ids.size());
+                const std::vector<const py::array *> columns = {&ids, &initials, &isBuy, &starts, &transactions,
+                                                                &validities, &prices, &quantities};
+                for (const py::array *column : columns) {
+                    if (column->ndim() != 1 || static_cast<size_t>(column->size()) != n) {
+                        throw std::invalid_argument("All order columns must be one-dimensional and of equal length");
+                    }
+                }
+                const int64_t *idData = ids.data();
+                const int64_t *initialData = initials.data();
+                const bool *isBuyData = isBuy.data();
+                const int64_t *startData = starts.data();
+                const int64_t *transactionData = transactions.data();
+                const int64_t *validityData = validities.data();
+                const double *priceData = prices.data();
+                const double *quantityData = quantities.data();
+
+                py::gil_scoped_release release;
+                self.writeOrderBinFromPandas(path,
+                                             numericColumn<WriterColumn<0>>(idData, n),
+                                             numericColumn<WriterColumn<1>>(initialData, n),
+                                             sideColumn<WriterColumn<2>>(isBuyData, n),
+                                             timeColumn<WriterColumn<3>>(startData, n, false),
+                                             timeColumn<WriterColumn<4>>(transactionData, n, true),
+                                             timeColumn<WriterColumn<5>>(validityData, n, true),
+                                             numericColumn<WriterColumn<6>>(priceData, n),
+                                             numericColumn<WriterColumn<7>>(quantityData, n));
+            },
+            py::arg("path"), py::arg("ids"), py::arg("initials"), py::arg("is_buy"), py::arg("starts_ms"),
+            py::arg("transactions_ms"), py::arg("validities_ms"), py::arg("prices"), py::arg("quantities"),
+            "Write an order binary from NumPy columns, with the timestamps as epoch milliseconds (UTC).")
         .def("writeOrderBinFromCSV", &sim::writeOrderBinFromCSV)
 
         // .def("loadForecastMapFromCSV", &Simulation::loadForecastMapFromCSV)
@@ -160,6 +314,66 @@ PYBIND11_MODULE(_bite, m) {
             return self.returnReward();
         })
 
+        // cheap counters for profiling, without converting any records to Python
+        .def("getLogSizes", [](sim &self) {
+            py::dict sizes;
+            sizes["decision_record"] = self.getDecisionData().size();
+            sizes["price_record"] = self.getPriceData().size();
+            sizes["accepted_orders"] = self.getAccOrders().size();
+            sizes["executed_orders"] = self.getExOrders().size();
+            sizes["forecast_orders"] = self.getForeOrders().size();
+            sizes["killed_orders"] = self.getRemOrders().size();
+            sizes["balancing_orders"] = self.getBalOrders().size();
+            return sizes;
+        }, "Returns the number of records in each log.")
+
+        .def("getLastStorage", [](sim &self) -> py::object {
+            const auto &decRecord = self.getDecisionData();
+            if (decRecord.empty()) {
+                return py::none();
+            }
+            return py::float_(decRecord.back().storage);
+        }, "Returns the storage level of the last finalized decision record, or None.")
+
+        // the DP run counter is only visible through the logged records; offsets as returned by getLogSizes,
+        // so per-day callers only scan the records added since their last call
+        .def("getMaxDpRunFrom", [](sim &self, size_t accFirst, size_t exFirst, size_t remFirst) {
+            int64_t lastRun = 0;
+            const auto &accOrders = self.getAccOrders();
+            if (accFirst < accOrders.size()) {
+                for (auto it = std::next(accOrders.begin(), accFirst); it != accOrders.end(); ++it) {
+                    lastRun = std::max<int64_t>(lastRun, it->_dpRun);
+                }
+            }
+            const auto &exOrders = self.getExOrders();
+            if (exFirst < exOrders.size()) {
+                for (auto it = std::next(exOrders.begin(), exFirst); it != exOrders.end(); ++it) {
+                    lastRun = std::max<int64_t>(lastRun, it->dpRun);
+                }
+            }
+            const auto &remOrders = self.getRemOrders();
+            if (remFirst < remOrders.size()) {
+                for (auto it = std::next(remOrders.begin(), remFirst); it != remOrders.end(); ++it) {
+                    lastRun = std::max<int64_t>(lastRun, it->dpRun);
+                }
+            }
+            return lastRun;
+        }, py::arg("acc_first"), py::arg("ex_first"), py::arg("rem_first"),
+        "Returns the highest DP run id among the accepted, executed and killed orders from the given indices on, or 0.")
+
+        // executed orders from index `first` on, so streaming callers only convert the new records
+        .def("getExecutedOrdersFrom", [](sim &self, size_t first) {
+            py::list execOrderList;
+            const auto &exOrders = self.getExOrders();
+            if (first >= exOrders.size()) {
+                return execOrderList;
+            }
+            for (auto it = std::next(exOrders.begin(), first); it != exOrders.end(); ++it) {
+                execOrderList.append(execOrderToDict(*it));
+            }
+            return execOrderList;
+        }, py::arg("first"), "Returns the executed orders from index 'first' on, as in getLogs.")
+
         .def("getLogs", [](sim &self) {
             // C++ -> Python
             auto decRecord = self.getDecisionData();
@@ -215,23 +429,7 @@ PYBIND11_MODULE(_bite, m) {
 
             py::list execOrderList;
             for (const auto &record : self.getExOrders()) {
-                // Create a Python dictionary to store the record
-                py::dict pyRecord;
-
-                pyRecord["dp_run"] = record.dpRun;
-                pyRecord["time"] = ExecMarketOrder::epochToDateTimeMS(record.time);
-                pyRecord["last_solve_time"] = ExecMarketOrder::epochToDateTimeMS(record.lastSolveTime);
-                pyRecord["hour"] = ExecMarketOrder::epochToDateTime(record.hour);
-                pyRecord["reward"] = record.reward / 1000.0;
-                pyRecord["reward_incl_deg_costs"] = record.rewardInclDegCosts / 1000.0;
-                pyRecord["volume"] = record.volume / 10.0;
-                pyRecord["type"] = record.type == LimitOrder::Type::Buy ? "Buy" : "Sell";
-                pyRecord["final_pos"] = record.finalPos / 10.0;
-                pyRecord["final_stor"] = record.finalStor / 10.0;
-                // pyRecord["prae_final_pos"] = record.praeFinalPos / 10.0;
-                // pyRecord["prae_final_stor"] = record.praeFinalStor / 10.0;
-                // pyRecord["prae_init_storage"] = record.praeInitStorage / 10.0;
-                execOrderList.append(pyRecord);
+                execOrderList.append(execOrderToDict(record));
             }
 
             py::list foreOrderList;
@@ -251,23 +449,7 @@ PYBIND11_MODULE(_bite, m) {
 
             py::list removedOrdersList;
             for (const auto &record : self.getRemOrders()) {
-                // Create a Python dictionary to store the record
-                py::dict pyRecord;
-
-                pyRecord["dp_run"] = record.dpRun;
-                pyRecord["time"] = ExecMarketOrder::epochToDateTimeMS(record.time);
-                pyRecord["last_solve_time"] = ExecMarketOrder::epochToDateTimeMS(record.lastSolveTime);
-                pyRecord["hour"] = ExecMarketOrder::epochToDateTime(record.hour);
-                pyRecord["reward"] = record.reward / 1000.0;
-                pyRecord["reward_incl_deg_costs"] = record.rewardInclDegCosts / 1000.0;
-                pyRecord["volume"] = record.volume / 10.0;
-                pyRecord["type"] = record.type == LimitOrder::Type::Buy ? "Buy" : "Sell";
-                pyRecord["final_pos"] = record.finalPos / 10.0;
-                pyRecord["final_stor"] = record.finalStor / 10.0;
-                // pyRecord["prae_final_pos"] = record.praeFinalPos / 10.0;
-                // pyRecord["prae_final_stor"] = record.praeFinalStor / 10.0;
-                // pyRecord["prae_init_storage"] = record.praeInitStorage / 10.0;
-                removedOrdersList.append(pyRecord);
+                removedOrdersList.append(execOrderToDict(record));
             }
 
             py::list balOrderList;
@@ -305,5 +487,72 @@ PYBIND11_MODULE(_bite, m) {
 
             return vol_price_list;
         }, py::arg("last"), py::arg("frequency"), py::arg("volumes"),
-        "Returns a list of dictionaries with volume and price pairs.");
+        "Returns a list of dictionaries with volume and price pairs.")
+
+        // same replay as return_vol_price_pairs, but exported as dense (time x delivery hour x volume) arrays;
+        // the volume axis holds the keys the engine returns (in its own units, see return_vol_price_pairs),
+        // only the time and delivery hour axes are converted to Python strings, NaN marks missing entries
+        .def("return_vol_price_arrays", [](sim &self, const bool last, const int frequency, const std::vector<int>& volumes) {
+            std::map<int64_t, std::map<int64_t, std::map<int, std::pair<int,int>>>> priceVolMap;
+            {
+                py::gil_scoped_release release;
+                priceVolMap = self.return_vol_price_pairs(last, frequency, volumes);
+            }
+
+            std::map<int64_t, py::ssize_t> delIdx;
+            std::map<int, py::ssize_t> volIdx;
+            for (const auto& [currTime, innerMap] : priceVolMap) {
+                for (const auto& [delHour, innerMap2] : innerMap) {
+                    delIdx.emplace(delHour, 0);
+                    for (const auto& [volume, price] : innerMap2) {
+                        volIdx.emplace(volume, 0);
+                    }
+                }
+            }
+            // every requested volume maps to one key, more keys than requested volumes can not be placed
+            const std::set<int> requested(volumes.begin(), volumes.end());
+            if (volIdx.size() > requested.size()) {
+                throw std::runtime_error("return_vol_price_pairs returned " + std::to_string(volIdx.size()) +
+                                         " volume keys for " + std::to_string(requested.size()) + " requested volumes");
+            }
+            py::list delHours;
+            py::ssize_t d = 0;
+            for (auto& [delHour, idx] : delIdx) {
+                idx = d++;
+                delHours.append(ExecMarketOrder::epochToDateTime(delHour));
+            }
+            py::array_t<int> volumeKeys(static_cast<py::ssize_t>(volIdx.size()));
+            int* keys = volumeKeys.mutable_data();
+            py::ssize_t v = 0;
+            for (auto& [volume, idx] : volIdx) {
+                keys[v] = volume;
+                idx = v++;
+            }
+
+            const py::ssize_t T = static_cast<py::ssize_t>(priceVolMap.size());
+            const py::ssize_t D = static_cast<py::ssize_t>(delIdx.size());
+            const py::ssize_t V = static_cast<py::ssize_t>(volIdx.size());
+            py::array_t<double> priceFull({T, D, V});
+            py::array_t<double> worstPrice({T, D, V});
+            double* full = priceFull.mutable_data();
+            double* worst = worstPrice.mutable_data();
+            std::fill(full, full + T * D * V, std::numeric_limits<double>::quiet_NaN());
+            std::fill(worst, worst + T * D * V, std::numeric_limits<double>::quiet_NaN());
+
+            py::list currTimes;
+            py::ssize_t t = 0;
+            for (const auto& [currTime, innerMap] : priceVolMap) {
+                currTimes.append(ExecMarketOrder::epochToDateTimeMS(currTime));
+                for (const auto& [delHour, innerMap2] : innerMap) {
+                    const py::ssize_t offset = (t * D + delIdx[delHour]) * V;
+                    for (const auto& [volume, price] : innerMap2) {
+                        full[offset + volIdx[volume]] = price.first / 1000.0;
+                        worst[offset + volIdx[volume]] = price.second / 100.0;
+                    }
+                }
+                ++t;
+            }
+            return py::make_tuple(currTimes, delHours, volumeKeys, priceFull, worstPrice);
+        }, py::arg("last"), py::arg("frequency"), py::arg("volumes"),
+        "Returns the times, delivery hours, engine volume keys and (time x delivery hour x volume) arrays of full and worst accepted prices.");
 }
\ No newline at end of file
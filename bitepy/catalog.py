@@ -0,0 +1,237 @@
+######################################################################
+# Copyright (C) 2025 ETH Zurich
+# BitePy: A Python Battery Intraday Trading Engine
+# Bits to Energy Lab - Chair of Information Management - ETH Zurich
+#
+# Author: David Schaurecker
+#
+# Licensed under MIT License, see https://opensource.org/license/mit
+######################################################################
+
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from .compression import COMPRESSED_SUFFIX
+
+CATALOG_FILE = "catalog.json"
+CATALOG_VERSION = 1
+
+
+class Catalog:
+    def __init__(self, path: str):
+        """
+        Initialize an (empty) catalog of the order binaries in a directory.
+
+        The catalog is stored as catalog.json next to the binaries and lists, for each file, the
+        covered transaction-time and delivery ranges, the number of orders, the file size and a
+        SHA-256 checksum. Use `Catalog.load` to read an existing catalog.
+
+        Args:
+            path (str): The directory containing the order binaries.
+        """
+        self.path = path
+        self.files = {}
+
+    @classmethod
+    def load(cls, path: str):
+        """
+        Load the catalog of a directory.
+
+        Args:
+            path (str): The directory containing the order binaries.
+
+        Returns:
+            Catalog: The catalog, empty if the directory has no catalog.json.
+        """
+        catalog = cls(path)
+        catalog_path = os.path.join(path, CATALOG_FILE)
+        if os.path.exists(catalog_path):
+            with open(catalog_path, "r") as f:
+                content = json.load(f)
+            if content.get("version") != CATALOG_VERSION:
+                raise ValueError(f"Unsupported catalog version {content.get('version')} in {catalog_path}")
+            catalog.files = content["files"]
+        return catalog
+
+    def save(self):
+        """Write the catalog atomically to catalog.json in the catalog directory."""
+        os.makedirs(self.path, exist_ok=True)
+        content = {"version": CATALOG_VERSION, "files": dict(sorted(self.files.items()))}
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix=".catalog-", suffix=".json")
+        with os.fdopen(fd, "w") as f:
+            json.dump(content, f, indent=1)
+        os.replace(tmp_path, os.path.join(self.path, CATALOG_FILE))
+
+    def __len__(self):
+        return len(self.files)
+
+    def add(self, bin_file_path: str, starts, transactions, validities, source: str = None):
+        """
+        Add or replace the entry of an order binary.
+
+        Args:
+            bin_file_path (str): Path to the written order binary, inside the catalog directory.
+            starts (array-like): Delivery start strings (ISO 8601, UTC) of the orders in the file, or a
+                datetime64 array (UTC).
+            transactions (array-like): Transaction time strings (ISO 8601, UTC) of the orders in the file, or a
+                datetime64 array (UTC).
+            validities (array-like): Validity time strings (ISO 8601, UTC) of the orders in the file, or a
+                datetime64 array (UTC).
+            source (str, optional): The file the binary was created from.
+        """
+        name = os.path.basename(bin_file_path)
+        entry = {
+            "orders": int(len(transactions)),
+            "transaction_first": _bound(transactions, min) if len(transactions) else None,
+            "transaction_last": _bound(transactions, max) if len(transactions) else None,
+            "validity_last": _bound(validities, max) if len(validities) else None,
+            "delivery_first": _bound(starts, min, unit="s") if len(starts) else None,
+            "delivery_last": _bound(starts, max, unit="s") if len(starts) else None,
+            "size": os.path.getsize(bin_file_path),
+            "sha256": _sha256(bin_file_path),
+            "source": os.path.basename(source) if source else None,
+        }
+        self.files[name] = entry
+
+    def add_segments(self, bin_file_path: str, segment_paths: list, source: str = None):
+        """
+        Add or replace the entry of a day that is stored as transaction-time segments.
+
+        The segments must already be catalogued with `add`. The day entry aggregates their ranges
+        and lists them in transaction-time order.
+
+        Args:
+            bin_file_path (str): Path of the (not written) day binary, e.g. orderbook_YYYY-MM-DD.bin.
+            segment_paths (list): Paths of the segment binaries of the day, in transaction-time order.
+            source (str, optional): The file the segments were created from.
+        """
+        parts = [self.files[os.path.basename(p)] for p in segment_paths]
+
+        def _agg(func, key):
+            values = [part[key] for part in parts if part[key] is not None]
+            return func(values) if values else None
+
+        self.files[os.path.basename(bin_file_path)] = {
+            "orders": sum(part["orders"] for part in parts),
+            "transaction_first": _agg(min, "transaction_first"),
+            "transaction_last": _agg(max, "transaction_last"),
+            "validity_last": _agg(max, "validity_last"),
+            "delivery_first": _agg(min, "delivery_first"),
+            "delivery_last": _agg(max, "delivery_last"),
+            "size": sum(part["size"] for part in parts),
+            "sha256": None,
+            "source": os.path.basename(source) if source else None,
+            "segments": [os.path.basename(p) for p in segment_paths],
+        }
+
+    def entry(self, bin_file_path: str):
+        """Return the catalog entry of an order binary, or None if it is not catalogued."""
+        return self.files.get(os.path.basename(bin_file_path))
+
+    def plan(self, paths: list, start: pd.Timestamp = None, end: pd.Timestamp = None):
+        """
+        Plan and validate the order binaries needed for a simulation before loading any of them.
+
+        Days stored as segments or block-compressed files are expanded to these files. If a window is given, files
+        whose orders can not affect it are dropped: all orders were submitted at or after `end`,
+        or all orders expired at or before `start`. Every remaining file must exist and, if it is
+        catalogued, its size must match the catalog.
+
+        Args:
+            paths (list): Paths of the day binaries, e.g. from `Simulation.get_data_bins_for_each_day`.
+            start (pd.Timestamp, optional): Start of the simulated window (timezone aware).
+            end (pd.Timestamp, optional): End of the simulated window (timezone aware).
+
+        Returns:
+            list: For each day in `paths`, a list of (path, entry) tuples of the files to load, in
+                loading order. Entries are None for files not in the catalog; a day's list is empty
+                if none of its files can affect the window.
+
+        Raises:
+            FileNotFoundError: If any of the files does not exist.
+            ValueError: If a file's size differs from its catalog entry.
+        """
+        planned = []
+        for p in paths:
+            entry = self.entry(p)
+            if entry is not None and entry.get("segments"):
+                parts = [(os.path.join(os.path.dirname(p), name), self.files.get(name)) for name in entry["segments"]]
+            elif entry is None and not os.path.exists(p) and os.path.exists(p[:-len(".bin")] + COMPRESSED_SUFFIX):
+                compressed_path = p[:-len(".bin")] + COMPRESSED_SUFFIX
+                parts = [(compressed_path, self.entry(compressed_path))]
+            else:
+                parts = [(p, entry)]
+            planned.append([(part_path, part_entry) for part_path, part_entry in parts
+                            if _can_affect(part_entry, start, end)])
+
+        missing = [p for parts in planned for p, _ in parts if not os.path.exists(p)]
+        if missing:
+            raise FileNotFoundError(f"{len(missing)} order binaries are missing, e.g. {missing[:3]}")
+        for parts in planned:
+            for p, entry in parts:
+                if entry is not None and os.path.getsize(p) != entry["size"]:
+                    raise ValueError(f"Size of {p} ({os.path.getsize(p)} bytes) does not match the catalog "
+                                     f"({entry['size']} bytes), the file was modified or truncated")
+        return planned
+
+    def verify(self, paths: list = None):
+        """
+        Verify the checksums of catalogued order binaries (reads the full files).
+
+        Args:
+            paths (list, optional): Paths of the files to verify. Defaults to all catalogued files.
+
+        Returns:
+            list: The paths whose checksum does not match the catalog.
+        """
+        if paths is None:
+            paths = [os.path.join(self.path, name) for name, entry in self.files.items() if not entry.get("segments")]
+        files = [p for parts in self.plan(paths) for p, _ in parts]
+        return [p for p in files if self.entry(p) is not None and _sha256(p) != self.entry(p)["sha256"]]
+
+    def to_frame(self):
+        """
+        Return the catalog as a DataFrame.
+
+        Returns:
+            pd.DataFrame: One row per catalogued file, indexed by file name, with timestamps in UTC.
+        """
+        df = pd.DataFrame.from_dict(self.files, orient="index")
+        for col in ["transaction_first", "transaction_last", "validity_last", "delivery_first", "delivery_last"]:
+            if col in df:
+                df[col] = pd.to_datetime(df[col], utc=True)
+        return df
+
+
+def _bound(values, func, unit: str = "ms"):
+    # datetime64 arrays are reduced by NumPy, ISO 8601 strings of one format sort chronologically
+    if isinstance(values, np.ndarray) and values.dtype.kind == "M":
+        bound = values.min() if func is min else values.max()
+        return np.datetime_as_string(bound, unit=unit) + "Z"
+    return str(func(values))
+
+
+def _can_affect(entry, start: pd.Timestamp, end: pd.Timestamp):
+    """Whether the orders of a catalogued file can affect the window [start, end)."""
+    if entry is None:
+        return True
+    if entry["orders"] == 0:
+        return False
+    if end is not None and pd.Timestamp(entry["transaction_first"]) >= end:
+        return False
+    if start is not None and pd.Timestamp(entry["validity_last"]) <= start:
+        return False
+    return True
+
+
+def _sha256(file_path: str, chunk_size: int = 1 << 20):
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
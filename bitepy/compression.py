@@ -0,0 +1,251 @@
+######################################################################
+# Copyright (C) 2025 ETH Zurich
+# BitePy: A Python Battery Intraday Trading Engine
+# Bits to Energy Lab - Chair of Information Management - ETH Zurich
+#
+# Author: David Schaurecker
+#
+# Licensed under MIT License, see https://opensource.org/license/mit
+######################################################################
+
+import json
+import os
+import struct
+import tempfile
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+COMPRESSED_SUFFIX = ".zbin"
+MAGIC = b"BITEZBIN"
+FORMAT_VERSION = 1
+CODECS = ("zstd", "lz4", "zlib")
+DEFAULT_BLOCK_ORDERS = 65_536
+# decimal scales tried (in order) to store prices and quantities as exact integers
+_DECIMAL_SCALES = (1, 10, 100, 1000, 10**6)
+
+
+def default_codec():
+    """Return the fastest available codec: zstd or lz4 if installed, zlib (standard library) otherwise."""
+    for codec in ("zstd", "lz4"):
+        try:
+            _codec_functions(codec)
+            return codec
+        except ImportError:
+            continue
+    return "zlib"
+
+
+def _codec_functions(codec: str, level: int = None):
+    """Return (compress, decompress) functions of a codec, all of them release the GIL."""
+    if codec == "zstd":
+        import zstandard
+        local = threading.local()
+
+        def _compress(data):
+            # compressor instances are not thread-safe, each thread keeps its own
+            if not hasattr(local, "compressor"):
+                local.compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+            return local.compressor.compress(data)
+        return _compress, lambda data: zstandard.ZstdDecompressor().decompress(data)
+    if codec == "lz4":
+        import lz4.frame
+        return (lambda data: lz4.frame.compress(data, compression_level=0 if level is None else level),
+                lz4.frame.decompress)
+    if codec == "zlib":
+        return lambda data: zlib.compress(data, 6 if level is None else level), zlib.decompress
+    raise ValueError(f"Unknown codec {codec}, use one of {CODECS}")
+
+
+def _iso_to_epoch(values, unit: str):
+    """Convert the ISO 8601 UTC strings of the order files to integer epoch seconds or milliseconds."""
+    return np.char.rstrip(np.asarray(values, dtype=str), "Z").astype(f"datetime64[{unit}]").astype(np.int64)
+
+
+def _epoch_to_iso(values: np.ndarray, unit: str):
+    return np.char.add(np.datetime_as_string(values.astype(f"datetime64[{unit}]"), unit=unit), "Z")
+
+
+def _encode_decimal(values: np.ndarray):
+    """Return (int64 values, scale) if all values are exact decimals of a scale, else (float64 values, None)."""
+    for scale in _DECIMAL_SCALES:
+        scaled = np.round(values * scale)
+        if np.all(np.abs(scaled / scale - values) <= 1e-9 * np.maximum(np.abs(values), 1.)):
+            return scaled.astype(np.int64), scale
+    return values, None
+
+
+def _delta(values: np.ndarray):
+    return np.diff(values, prepend=values.dtype.type(0))
+
+
+def _encode_block(arrays: dict, lo: int, hi: int):
+    """Serialize one block of orders: delta-encoded integer columns, concatenated in a fixed order."""
+    block = [
+        _delta(arrays["id"][lo:hi]),
+        _delta(arrays["initial"][lo:hi]),
+        arrays["side"][lo:hi],
+        _delta(arrays["transaction"][lo:hi]),
+        arrays["validity"][lo:hi] - arrays["transaction"][lo:hi],
+        arrays["start"][lo:hi] - arrays["transaction"][lo:hi] // 1000,
+        _delta(arrays["price"][lo:hi]) if arrays["price"].dtype == np.int64 else arrays["price"][lo:hi],
+        _delta(arrays["quantity"][lo:hi]) if arrays["quantity"].dtype == np.int64 else arrays["quantity"][lo:hi],
+    ]
+    return b"".join(np.ascontiguousarray(col).tobytes() for col in block)
+
+
+def _decode_block(data: bytes, n: int, price_int: bool, quantity_int: bool):
+    """Inverse of `_encode_block`, returns the integer (or float) columns of the block."""
+    offset = 0
+
+    def _take(dtype):
+        nonlocal offset
+        col = np.frombuffer(data, dtype=dtype, count=n, offset=offset)
+        offset += n * np.dtype(dtype).itemsize
+        return col
+
+    ids = np.cumsum(_take(np.int64))
+    initials = np.cumsum(_take(np.int64))
+    sides = _take(np.uint8)
+    transactions = np.cumsum(_take(np.int64))
+    validities = _take(np.int64) + transactions
+    starts = _take(np.int64) + transactions // 1000
+    prices = np.cumsum(_take(np.int64)) if price_int else _take(np.float64)
+    quantities = np.cumsum(_take(np.int64)) if quantity_int else _take(np.float64)
+    return ids, initials, sides, starts, transactions, validities, prices, quantities
+
+
+def write_compressed_orders(file_path: str, columns: tuple, codec: str = None, level: int = None,
+                            block_orders: int = DEFAULT_BLOCK_ORDERS, threads: int = None):
+    """
+    Write orders as a block-compressed order file (.zbin).
+
+    Orders are split into blocks of `block_orders` orders that are compressed independently (in
+    parallel). Within a block, the columns are stored one after the other: ids, initials and
+    transaction times delta-encoded, validity and delivery start relative to the transaction time,
+    and prices and quantities as delta-encoded integers of their decimal scale (if they have one).
+
+    Args:
+        file_path (str): Path of the file to write, written atomically.
+        columns (tuple): The order columns ids, initials, sides, starts, transactions, validities, prices,
+            quantities, as written by `Data.create_bins_from_csv`.
+        codec (str, optional): "zstd", "lz4" or "zlib". Defaults to the fastest installed codec.
+        level (int, optional): Compression level of the codec. Defaults to the codec's default.
+        block_orders (int, optional): Number of orders per block. Defaults to 65536.
+        threads (int, optional): Number of compression threads. Defaults to the number of CPUs.
+
+    Returns:
+        int: The size of the written file in bytes.
+    """
+    if block_orders <= 0:
+        raise ValueError("block_orders must be > 0")
+    codec = default_codec() if codec is None else codec
+    compress, _ = _codec_functions(codec, level)
+
+    ids, initials, sides, starts, transactions, validities, prices, quantities = columns
+    side_values, side_codes = np.unique(np.asarray(sides, dtype=str), return_inverse=True)
+    if len(side_values) > 255:
+        raise ValueError("Too many distinct order sides to compress")
+    prices, price_scale = _encode_decimal(np.asarray(prices, dtype=np.float64))
+    quantities, quantity_scale = _encode_decimal(np.asarray(quantities, dtype=np.float64))
+    arrays = {
+        "id": np.asarray(ids, dtype=np.int64),
+        "initial": np.asarray(initials, dtype=np.int64),
+        "side": side_codes.astype(np.uint8),
+        "start": _iso_to_epoch(starts, "s"),
+        "transaction": _iso_to_epoch(transactions, "ms"),
+        "validity": _iso_to_epoch(validities, "ms"),
+        "price": prices,
+        "quantity": quantities,
+    }
+
+    num_orders = len(arrays["id"])
+    bounds = list(range(0, num_orders, block_orders)) + [num_orders]
+    ranges = list(zip(bounds[:-1], bounds[1:]))
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        blocks = list(pool.map(lambda r: compress(_encode_block(arrays, *r)), ranges))
+
+    header = {
+        "version": FORMAT_VERSION,
+        "codec": codec,
+        "orders": num_orders,
+        "sides": side_values.tolist(),
+        "price_scale": price_scale,
+        "quantity_scale": quantity_scale,
+        "blocks": [{"orders": hi - lo, "size": len(block)} for (lo, hi), block in zip(ranges, blocks)],
+    }
+    header_bytes = json.dumps(header).encode()
+
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".zbin-")
+    with os.fdopen(fd, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header_bytes)))
+        f.write(header_bytes)
+        for block in blocks:
+            f.write(block)
+    os.replace(tmp_path, file_path)
+    return os.path.getsize(file_path)
+
+
+def read_compressed_header(file_path: str):
+    """Return the header of a block-compressed order file and the offset of its first block."""
+    with open(file_path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{file_path} is not a block-compressed order file")
+        (header_size,) = struct.unpack("<I", f.read(4))
+        header = json.loads(f.read(header_size))
+    if header.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported order file version {header.get('version')} in {file_path}")
+    return header, len(MAGIC) + 4 + header_size
+
+
+def read_compressed_orders(file_path: str, threads: int = None):
+    """
+    Read a block-compressed order file (.zbin).
+
+    The blocks are decompressed and decoded in parallel, the timestamps are converted back to the
+    ISO 8601 strings of the order files in a single vectorized pass.
+
+    Args:
+        file_path (str): Path of the file.
+        threads (int, optional): Number of decompression threads. Defaults to the number of CPUs.
+
+    Returns:
+        tuple: The order columns ids, initials, sides, starts, transactions, validities, prices,
+            quantities as lists, as accepted by the simulation's order queue.
+    """
+    header, offset = read_compressed_header(file_path)
+    _, decompress = _codec_functions(header["codec"])
+    price_scale, quantity_scale = header["price_scale"], header["quantity_scale"]
+
+    with open(file_path, "rb") as f:
+        f.seek(offset)
+        raw_blocks = [(f.read(block["size"]), block["orders"]) for block in header["blocks"]]
+
+    def _decode(raw_block):
+        data, n = raw_block
+        return _decode_block(decompress(data), n, price_scale is not None, quantity_scale is not None)
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        decoded = list(pool.map(_decode, raw_blocks))
+
+    if decoded:
+        cols = [np.concatenate(col) for col in zip(*decoded)]
+    else:
+        cols = [np.empty(0, dtype=np.int64)] * 8
+    ids, initials, sides, starts, transactions, validities, prices, quantities = cols
+    prices = prices / price_scale if price_scale is not None else prices
+    quantities = quantities / quantity_scale if quantity_scale is not None else quantities
+    return (
+        ids.tolist(),
+        initials.tolist(),
+        np.asarray(header["sides"], dtype=str)[sides].tolist() if len(sides) else [],
+        _epoch_to_iso(starts, "s").tolist(),
+        _epoch_to_iso(transactions, "ms").tolist(),
+        _epoch_to_iso(validities, "ms").tolist(),
+        prices.astype(np.float64).tolist(),
+        quantities.astype(np.float64).tolist(),
+    )
@@ -10,10 +10,18 @@
 
 import pandas as pd
 import numpy as np
-from zipfile import ZipFile
+from zipfile import ZipFile, ZIP_DEFLATED
+import heapq
+import io
 import os
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from tqdm import tqdm
 
+from .catalog import Catalog
+from .state import ProcessingState
+from .compression import CODECS, COMPRESSED_SUFFIX, read_compressed_orders, write_compressed_orders
+
 try:
     from ._bite import Simulation_cpp
 except ImportError as e:
@@ -22,6 +30,51 @@ except ImportError as e:
     ) from e
 
 
+# raw EPEX order file formats, as read by Data._read_id_table_2020 and Data._read_id_table_2021
+_RAW_FORMATS = {
+    2020: {
+        "file_prefix": "Continuous_Orders_DE_",
+        "read_kwargs": {"sep": ";", "decimal": "."},
+        "columns": {"Order ID": "order", "Initial ID": "initial", "Delivery Start": "start", "Side": "side",
+                    "Price": "price", "Validity time": "validity", "Action code": "action",
+                    "Transaction Time": "transaction", "Quantity": "quantity"},
+        "dedup": ["Order ID", "Initial ID", "Action code", "Validity time", "Price", "Quantity"],
+        "block": ("Is User Defined Block", 0),
+        "product": "Product",
+        "output": ["initial", "side", "start", "transaction", "validity", "price", "quantity"],
+        "upper_side": True,
+    },
+    2021: {
+        "file_prefix": "Continuous_Orders-DE-",
+        "read_kwargs": {"sep": ",", "decimal": ".", "skiprows": 1},
+        "columns": {"OrderId": "order", "InitialId": "initial", "DeliveryStart": "start", "Side": "side",
+                    "Price": "price", "ValidityTime": "validity", "ActionCode": "action",
+                    "TransactionTime": "transaction", "Quantity": "quantity"},
+        "dedup": ["OrderId", "InitialId", "ActionCode", "ValidityTime", "Price", "Quantity"],
+        "block": ("UserDefinedBlock", "N"),
+        "product": "Product",
+        "output": ["transaction", "initial", "side", "start", "price", "quantity", "validity"],
+        "upper_side": False,
+    },
+}
+# order columns in the order of the engine's order queue
+ORDER_COLUMNS = ("id", "initial", "side", "start", "transaction", "validity", "price", "quantity")
+# bump when the parsed output changes, so incremental runs redo all days
+PARSE_VERSION = "parse-1"
+PARSE_STATE_FILE = "parse_state.json"
+BINS_STATE_FILE = "bins_state.json"
+_RAW_PRODUCTS = ["Intraday_Hour_Power", "XBID_Hour_Power"]
+_RAW_ACTIONS = {"A": 0, "C": 1, "D": 2, "I": 3}
+# rough in-memory size of one raw order message in a pandas chunk, used to size the chunks
+_RAW_ROW_BYTES = 1024
+
+
+def _epoch_ms_to_iso(epoch_ms: np.ndarray, unit: str = "ms"):
+    """Vectorized conversion of epoch milliseconds to the ISO 8601 UTC strings used in the order files."""
+    values = epoch_ms if unit == "ms" else epoch_ms // 1000
+    return np.char.add(np.datetime_as_string(values.astype(f"datetime64[{unit}]"), unit=unit), "Z")
+
+
 class Data:
     def __init__(self):
         """Initialize a Data instance."""
@@ -46,15 +99,23 @@ class Data:
             },
         )
         df.rename(columns={"Unnamed: 0": "id"}, inplace=True)
-        ids = df["id"].to_numpy(dtype=np.int64).tolist()
-        initials = df["initial"].to_numpy(dtype=np.int64).tolist()
-        sides = df["side"].to_numpy(dtype="str").tolist()
-        starts = df["start"].to_numpy(dtype="str").tolist()
-        transactions = df["transaction"].to_numpy(dtype="str").tolist()
-        validities = df["validity"].to_numpy(dtype="str").tolist()
-        prices = df["price"].to_numpy(dtype=np.float64).tolist()
-        quantities = df["quantity"].to_numpy(dtype=np.float64).tolist()
-        return ids, initials, sides, starts, transactions, validities, prices, quantities
+        return _order_columns(df)
+
+    def load_orders(self, file_path: str):
+        """
+        Load a file of pre-processed orders as the column lists of the simulation's order queue.
+
+        Args:
+            file_path (str): A zipped CSV file (see `parse_market_data`) or a block-compressed order
+                file (.zbin, see `create_bins_from_csv`).
+
+        Returns:
+            tuple: The order columns ids, initials, sides, starts, transactions, validities, prices,
+                quantities as lists.
+        """
+        if file_path.endswith(COMPRESSED_SUFFIX):
+            return read_compressed_orders(file_path)
+        return self._load_csv(file_path)
 
     def _read_id_table_2020(self, timestamp, datapath):
         year = timestamp.strftime("%Y")
@@ -230,7 +291,180 @@ class Data:
         
         return df
 
-    def parse_market_data(self, start_date_str: str, end_date_str: str, marketdatapath: str, savepath: str, verbose: bool = True):
+    def _raw_day_reader(self, timestamp, datapath, fmt: dict, usecols: list, chunk_rows: int):
+        """Return a chunked reader over the raw EPEX order file of a day, restricted to usecols."""
+        zip_file_path = self._raw_file_path(timestamp, datapath)
+        zip_file = ZipFile(zip_file_path)
+        dtypes = {col: "string" for col in usecols}
+        dtypes.update({fmt["dedup"][0]: np.int64, fmt["dedup"][1]: np.int64,
+                       fmt["dedup"][4]: np.float64, fmt["dedup"][5]: np.float64,
+                       fmt["block"][0]: np.int64 if isinstance(fmt["block"][1], int) else "string"})
+        return pd.read_csv(zip_file.open(os.path.basename(zip_file_path)[:-4]), usecols=usecols, chunksize=chunk_rows,
+                           dtype={col: dtype for col, dtype in dtypes.items() if col in usecols},
+                           **fmt["read_kwargs"])
+
+    def _resolve_raw_day(self, timestamp, datapath, fmt: dict, chunk_rows: int):
+        """
+        First pass of the streaming parser over one raw day: deduplicate, filter and resolve change, cancel
+        and iceberg messages on a compact per-message state table (about 40 bytes per message).
+
+        Returns:
+            tuple: The sorted positions (row index in the raw file) of the orders to keep, and their validity
+                in epoch milliseconds, or the minimal int64 value where the raw validity is kept.
+        """
+        names = {v: k for k, v in fmt["columns"].items()}
+        block_col, block_value = fmt["block"]
+        usecols = fmt["dedup"] + [block_col, fmt["product"], names["transaction"]]
+        hashes, positions, orders, initials, actions, transactions = [], [], [], [], [], []
+        for chunk in self._raw_day_reader(timestamp, datapath, fmt, usecols, chunk_rows):
+            hashes.append(pd.util.hash_pandas_object(chunk[fmt["dedup"]], index=False).to_numpy())
+            chunk = chunk.loc[(chunk[block_col] == block_value).to_numpy(dtype=bool)
+                              & chunk[fmt["product"]].isin(_RAW_PRODUCTS).to_numpy(dtype=bool)
+                              & chunk[names["action"]].isin(list(_RAW_ACTIONS)).to_numpy(dtype=bool)]
+            positions.append(chunk.index.to_numpy(dtype=np.int64))
+            orders.append(chunk[names["order"]].to_numpy(dtype=np.int64))
+            initials.append(chunk[names["initial"]].to_numpy(dtype=np.int64))
+            actions.append(chunk[names["action"]].map(_RAW_ACTIONS).to_numpy(dtype=np.int8))
+            transactions.append(pd.to_datetime(chunk[names["transaction"]], format="%Y-%m-%dT%H:%M:%S.%fZ")
+                                .to_numpy().astype("datetime64[ms]").astype(np.int64))
+        hashes = np.concatenate(hashes)
+        position, order, initial, action, transaction = (
+            np.concatenate(col) for col in (positions, orders, initials, actions, transactions))
+
+        # drop duplicates (first occurrence in the raw file wins), then iceberg orders
+        first = np.zeros(len(hashes), dtype=bool)
+        first[np.unique(hashes, return_index=True)[1]] = True
+        keep = first[position]
+        keep &= ~np.isin(initial, initial[keep & (action == _RAW_ACTIONS["I"])])
+        position, order, action, transaction = position[keep], order[keep], action[keep], transaction[keep]
+        validity = np.full(len(position), np.iinfo(np.int64).min, dtype=np.int64)
+
+        # change messages: orders are chains of their add messages (by transaction time) followed by their
+        # change messages (in file order); every change message ends the validity of the latest (by transaction
+        # time) message before it in the chain, and then becomes an add message itself
+        is_add, is_change = action == _RAW_ACTIONS["A"], action == _RAW_ACTIONS["C"]
+        in_chain = is_add | (is_change & np.isin(order, order[is_add]))
+        chain = np.flatnonzero(in_chain)
+        chain = chain[np.lexsort((np.where(is_add[chain], transaction[chain], position[chain]), is_change[chain], order[chain]))]
+        if len(chain):
+            # running argmax of (order, transaction time) along the chain, chains start with an add message
+            group = np.cumsum(np.append(True, order[chain][1:] != order[chain][:-1]))
+            key = group * len(chain) + np.unique(transaction[chain], return_inverse=True)[1].reshape(-1)
+            latest_before = np.maximum.accumulate(np.where(key == np.maximum.accumulate(key), np.arange(len(chain)), 0))
+            link = np.flatnonzero(is_change[chain])
+            validity[chain[latest_before[link - 1]]] = transaction[chain[link]]
+
+        # cancel messages end the validity of the latest link of their order's chain (the last cancel wins)
+        latest = chain[np.lexsort((transaction[chain], order[chain]))]
+        latest = latest[np.append(order[latest][1:] != order[latest][:-1], True)]
+        cancels = np.flatnonzero(action == _RAW_ACTIONS["D"])
+        cancels = cancels[np.isin(order[cancels], order[latest])]
+        cancels = cancels[np.argsort(position[cancels], kind="stable")]
+        target = np.searchsorted(order[latest], order[cancels])
+        validity[latest[target]] = transaction[cancels]
+
+        keep = action != _RAW_ACTIONS["D"]
+        return position[keep], validity[keep]
+
+    def _write_raw_day_runs(self, timestamp, datapath, fmt: dict, chunk_rows: int, run_dir: str, dates: set):
+        """
+        Second pass of the streaming parser over one raw day: format the kept orders chunk by chunk and write
+        them as runs sorted by transaction time, one per chunk and transaction date in dates.
+
+        Returns:
+            dict: The run file paths per transaction date (datetime.date).
+        """
+        keep_position, keep_validity = self._resolve_raw_day(timestamp, datapath, fmt, chunk_rows)
+        names = {v: k for k, v in fmt["columns"].items()}
+        usecols = [names[col] for col in fmt["output"]]
+        runs = {}
+        for k, chunk in enumerate(self._raw_day_reader(timestamp, datapath, fmt, usecols, chunk_rows)):
+            idx = np.searchsorted(keep_position, chunk.index.to_numpy(dtype=np.int64))
+            idx[idx == len(keep_position)] = 0
+            kept = keep_position[idx] == chunk.index.to_numpy(dtype=np.int64)
+            chunk = chunk.loc[kept].rename(columns=fmt["columns"])
+            validity = keep_validity[idx[kept]]
+
+            transaction = (pd.to_datetime(chunk["transaction"], format="%Y-%m-%dT%H:%M:%S.%fZ")
+                           .to_numpy().astype("datetime64[ms]").astype(np.int64))
+            raw_validity = (pd.to_datetime(chunk["validity"], format="%Y-%m-%dT%H:%M:%SZ")
+                            .to_numpy().astype("datetime64[ms]").astype(np.int64))
+            start = (pd.to_datetime(chunk["start"], format="%Y-%m-%dT%H:%M:%SZ")
+                     .to_numpy().astype("datetime64[ms]").astype(np.int64))
+            validity = np.where(validity == np.iinfo(np.int64).min, raw_validity, validity)
+            chunk = chunk.assign(transaction=_epoch_ms_to_iso(transaction), validity=_epoch_ms_to_iso(validity),
+                                 start=_epoch_ms_to_iso(start, unit="s"))
+            if fmt["upper_side"]:
+                chunk["side"] = chunk["side"].str.upper()
+            chunk = chunk[fmt["output"]]
+
+            day = transaction.astype("datetime64[ms]").astype("datetime64[D]")
+            for date in dates:
+                run = chunk.loc[day == np.datetime64(date, "D")]
+                if run.empty:
+                    continue
+                run_path = os.path.join(run_dir, f"{timestamp.date()}_{k}_{date}.csv")
+                run.sort_values(by="transaction", kind="stable").fillna("").to_csv(run_path, header=False)
+                runs.setdefault(date, []).append(run_path)
+        return runs
+
+    def _merge_runs(self, run_paths: list, file_path: str, columns: list):
+        """Merge sorted runs by transaction time into a zipped CSV, in the layout of the in-memory parser."""
+        key_field = 1 + columns.index("transaction")
+        files = [open(p, "r") for p in run_paths]
+        try:
+            with ZipFile(file_path, "w", compression=ZIP_DEFLATED) as zf:
+                with zf.open(os.path.basename(file_path)[:-len(".zip")], "w", force_zip64=True) as member:
+                    out = io.TextIOWrapper(member, encoding="utf-8", newline="")
+                    out.write("," + ",".join(columns) + "\n")
+                    out.writelines(heapq.merge(*files, key=lambda line: line.split(",", key_field + 1)[key_field]))
+                    out.flush()
+                    out.detach()
+        finally:
+            for f in files:
+                f.close()
+
+    def _parse_market_data_streaming(self, dates, marketdatapath: str, savepath: str, max_memory_mb: float,
+                                     include_next: bool, day_written):
+        """
+        Chunked variant of parse_market_data with bounded memory for consecutive dates, see `parse_market_data`.
+
+        If include_next is True, the raw file of the day after the last date is read as well. day_written is
+        called with each written date.
+        """
+        chunk_rows = max(1_000, int(max_memory_mb * 1024**2 / _RAW_ROW_BYTES))
+        files = list(dates) + ([dates[-1] + pd.Timedelta(days=1)] if include_next else [])
+        with tempfile.TemporaryDirectory(prefix="bitepy-parse-") as run_dir:
+            runs = {}
+            for i, dt in enumerate(files):
+                if dt.year < 2020:
+                    raise ValueError("Error: Year not >= 2020")
+                fmt = _RAW_FORMATS[2020 if dt.year == 2020 else 2021]
+                # a raw day contains orders of its own and the previous UTC transaction date
+                wanted = {d.date() for d in dates[max(i - 1, 0):i + 1]}
+                for date, paths in self._write_raw_day_runs(dt, marketdatapath, fmt, chunk_rows, run_dir, wanted).items():
+                    runs.setdefault(date, []).extend(paths)
+
+                done = [dates[i - 1]] if i > 0 else []
+                if i == len(dates) - 1 and not include_next:
+                    done.append(dt)
+                for day in done:
+                    day_fmt = _RAW_FORMATS[2020 if day.year == 2020 else 2021]
+                    run_paths = runs.pop(day.date(), [])
+                    self._merge_runs(run_paths, f"{savepath}orderbook_{day.date()}.csv.zip", day_fmt["output"])
+                    for p in run_paths:
+                        os.remove(p)
+                    day_written(day)
+
+    def _raw_file_path(self, timestamp, datapath):
+        """Return the path of the raw EPEX order file (zip) of a day."""
+        fmt = _RAW_FORMATS[2020 if timestamp.year == 2020 else 2021]
+        folder = f"{datapath}/{timestamp.strftime('%Y')}/{timestamp.strftime('%m')}"
+        datestr = fmt["file_prefix"] + timestamp.strftime("%Y%m%d")
+        return f"{folder}/{[i for i in os.listdir(folder) if datestr in i][0]}"
+
+    def parse_market_data(self, start_date_str: str, end_date_str: str, marketdatapath: str, savepath: str, verbose: bool = True,
+                          max_memory_mb: float = None, incremental: bool = False):
         """
         Parse EPEX market data between two dates and save processed zipped CSV files.
 
@@ -249,6 +483,17 @@ class Data:
             marketdatapath (str): Path to the market data folder containing yearly/monthly subfolders with zipped files.
             savepath (str): Directory path where the parsed CSV files should be saved.
             verbose (bool, optional): If True, print progress messages. Defaults to True.
+            max_memory_mb (float, optional): If set, parse in streaming mode: raw files are read in chunks sized
+                to this budget, change and cancel messages are resolved on a compact per-message state table
+                (about 40 bytes per raw message, on top of the budget), and each day is written by merging
+                sorted runs from a temporary directory. Use it for very large days or to parse many days in
+                parallel. Defaults to None (whole days are loaded into memory).
+            incremental (bool, optional): If True, skip days whose output is up to date. A day is redone if its
+                output is missing or was modified, or if its own raw file or the next day's raw file (which
+                contains the last hours of the UTC day) changed since it was written. The fingerprints are kept
+                in parse_state.json in savepath, which is only read and updated by incremental runs (hashing
+                the files is skipped otherwise); days rewritten by a full run are redone by the next
+                incremental run, as their output changed. Defaults to False.
         """
         if not os.path.exists(savepath):
             os.makedirs(savepath)
@@ -260,13 +505,55 @@ class Data:
             raise ValueError("Error: Start date is after end date.")
         if start_date.year < 2020:
             raise ValueError("Error: Years before 2020 are not supported.")
+        if max_memory_mb is not None and max_memory_mb <= 0:
+            raise ValueError("max_memory_mb must be > 0")
 
         dates = pd.date_range(start_date, end_date, freq="D")
+        state = ProcessingState.load(savepath, PARSE_STATE_FILE) if incremental else None
+
+        def _sources(day):
+            days = [day] + ([day + pd.Timedelta(days=1)] if day + pd.Timedelta(days=1) <= end_date else [])
+            return [self._raw_file_path(d, marketdatapath) for d in days]
+
+        def _output(day):
+            return f"{savepath}orderbook_{day.date()}.csv.zip"
+
+        def _day_written(day):
+            if incremental:
+                state.record(os.path.basename(_output(day)), _sources(day), PARSE_VERSION, [_output(day)])
+                state.save()
+            pbar.update(1)
+
+        skip = set()
+        if incremental:
+            skip = {day for day in dates
+                    if state.is_up_to_date(os.path.basename(_output(day)), _sources(day), PARSE_VERSION)}
+
+        if max_memory_mb is not None:
+            with tqdm(total=len(dates), desc="Loading and saving CSV data", ncols=100, disable=not verbose) as pbar:
+                pbar.update(len(skip))
+                redo = [day for day in dates if day not in skip]
+                # parse consecutive runs of days to redo, each with the raw file following it
+                while redo:
+                    k = 1
+                    while k < len(redo) and redo[k] - redo[k - 1] == pd.Timedelta(days=1):
+                        k += 1
+                    pbar.set_description(f"Currently loading and saving dates {redo[0].date()} - {redo[k - 1].date()} ... ")
+                    self._parse_market_data_streaming(redo[:k], marketdatapath, savepath, max_memory_mb,
+                                                      redo[k - 1] < end_date, _day_written)
+                    redo = redo[k:]
+            print("\nWriting CSV data completed.")
+            return
+
         df1 = pd.DataFrame()
         df2 = pd.DataFrame()
         
         with tqdm(total=len(dates), desc="Loading and saving CSV data", ncols=100, disable=not verbose) as pbar:
             for dt1 in dates:
+                if dt1 in skip:
+                    df2 = pd.DataFrame()
+                    pbar.update(1)
+                    continue
                 pbar.set_description(f"Currently loading and saving date {str(dt1.date())} ... ")
                 df1 = df2
                 df2 = pd.DataFrame()
@@ -296,44 +583,406 @@ class Data:
                 daily_filename = f"{savepath}orderbook_{save_date}.csv"
                 compression_options = dict(method='zip', archive_name=f'{daily_filename.split("/")[-1]}')
                 group.drop(columns='transaction_date').sort_values(by='transaction').fillna("").to_csv(f'{daily_filename}.zip', compression=compression_options)
-                pbar.update(1)
+                _day_written(dt1)
         
         print("\nWriting CSV data completed.")
 
-    def create_bins_from_csv(self, csv_list: list, save_path: str, verbose: bool = True):
+    def _write_order_bin(self, _sim, catalog: Catalog, bin_file_path: str, columns: tuple, source: str,
+                         segment_hours: int = None, compression: str = None, epoch_ms: bool = False):
+        """
+        Write one day of orders as a binary (or as transaction-time segments) and record it in the catalog.
+
+        Args:
+            columns (tuple): The order columns ids, initials, sides, starts, transactions, validities, prices,
+                quantities as lists, sorted by transaction time.
+            compression (str, optional): Codec of block-compressed files (.zbin), None for engine binaries.
+            epoch_ms (bool, optional): If True, the columns are NumPy arrays with buy flags as sides and epoch
+                milliseconds as timestamps, written by `writeOrderBinFromArrays` without converting every
+                order to Python objects. Only for engine binaries without segments.
+        """
+        if epoch_ms and (segment_hours is not None or compression is not None):
+            raise ValueError("NumPy order columns can only be written as engine binaries without segments")
+
+        def _write(path, file_columns):
+            if compression is None:
+                # write next to the target and rename, so interrupted runs never leave truncated binaries
+                fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".bin-", suffix=".bin")
+                os.close(fd)
+                try:
+                    if epoch_ms:
+                        _sim.writeOrderBinFromArrays(tmp_path, *file_columns)
+                    else:
+                        _sim.writeOrderBinFromPandas(tmp_path, *file_columns)
+                    os.replace(tmp_path, path)
+                finally:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+            else:
+                write_compressed_orders(path, file_columns, codec=compression)
+            if epoch_ms:
+                catalog.add(path, *(np.asarray(col).view("datetime64[ms]") for col in file_columns[3:6]), source=source)
+            else:
+                catalog.add(path, file_columns[3], file_columns[4], file_columns[5], source=source)
+
+        suffix = ".bin" if compression is None else COMPRESSED_SUFFIX
+
+        # drop stale files of a previous layout of this day
+        previous = catalog.entry(bin_file_path)
+        if previous is not None and previous.get("segments"):
+            for name in previous["segments"]:
+                if os.path.exists(os.path.join(catalog.path, name)):
+                    os.remove(os.path.join(catalog.path, name))
+                catalog.files.pop(name, None)
+        if (segment_hours is not None or compression is not None) and os.path.exists(bin_file_path):
+            os.remove(bin_file_path)
+
+        if segment_hours is None and compression is None:
+            _write(bin_file_path, columns)
+            return
+        if segment_hours is None:
+            # a compressed day is catalogued as a day with a single segment
+            compressed_path = bin_file_path[:-len(".bin")] + COMPRESSED_SUFFIX
+            _write(compressed_path, columns)
+            catalog.add_segments(bin_file_path, [compressed_path], source=source)
+            return
+
+        transactions = columns[4]
+        segment = np.fromiter((int(t[11:13]) // segment_hours for t in transactions), dtype=np.int64, count=len(transactions))
+        if np.any(np.diff(segment) < 0):
+            raise ValueError(f"Orders of {source} must be sorted by transaction time to be segmented")
+        bounds = np.searchsorted(segment, np.arange(24 // segment_hours + 1), side="left")
+        segment_paths = []
+        for k in range(len(bounds) - 1):
+            lo, hi = bounds[k], bounds[k + 1]
+            if lo == hi:
+                continue
+            segment_path = bin_file_path[:-len(".bin")] + f"_{k * segment_hours:02d}{suffix}"
+            _write(segment_path, tuple(col[lo:hi] for col in columns))
+            segment_paths.append(segment_path)
+        catalog.add_segments(bin_file_path, segment_paths, source=source)
+
+    def _convert_csv_to_bin(self, csv_file_path: str, bin_file_path: str, previous: dict, segment_hours: int,
+                            compression: str):
+        """
+        Convert one zipped CSV file in a worker process of create_bins_from_csv.
+
+        Args:
+            previous (dict): The catalog entries of the day's previous files, to remove stale files.
+
+        Returns:
+            dict: The new catalog entries of the written files.
+        """
+        catalog = Catalog(os.path.dirname(bin_file_path))
+        catalog.files = dict(previous)
+        columns = self._load_csv(csv_file_path)
+        self._write_order_bin(Simulation_cpp(), catalog, bin_file_path, columns, csv_file_path, segment_hours, compression)
+        return catalog.files
+
+    def create_bins_from_csv(self, csv_list: list, save_path: str, verbose: bool = True, segment_hours: int = None,
+                             compression: str = None, incremental: bool = False, workers: int = None):
         """
         Convert zipped CSV files of pre-processed order book data into binary files.
 
         This method sequentially loads each previously generated zipped CSV file, converts it to a binary format using the C++ simulation
         extension, and saves the binary file in the specified directory. Binary files allow for much (10x) quicker loading
-        of the data at runtime.
+        of the data at runtime. Each written file is recorded in the directory's catalog (catalog.json, see `Catalog`),
+        which `Simulation.run` uses to validate the data set before loading it.
 
         Args:
             csv_list (list): List of file paths to the zipped CSV files containing pre-processed order book data.
             save_path (str): Directory path where the binary files should be saved. The binary files will use the same base name as the CSV files.
             verbose (bool, optional): If True, print progress messages. Defaults to True.
+            segment_hours (int, optional): If set, split each day by transaction time into files of this many hours
+                (orderbook_YYYY-MM-DD_HH.bin, must divide 24). The catalog maps the day to its segments, so `Simulation.run`
+                only loads the segments that can affect the simulated window. Defaults to None (one file per day).
+            compression (str, optional): If set ("zstd", "lz4" or "zlib"), write block-compressed files
+                (orderbook_YYYY-MM-DD.zbin) instead of engine binaries. They are several times smaller and are
+                decompressed with multiple threads when loaded, which pays off on slow (network) storage.
+                zstd and lz4 require the zstandard and lz4 packages. Defaults to None (uncompressed).
+            incremental (bool, optional): If True, skip days whose binaries are up to date, i.e. were written with
+                the same options from the current content of their CSV file and were not modified since. The
+                fingerprints are kept in bins_state.json in save_path, which is only read and updated by incremental
+                runs (hashing the files is skipped otherwise). Defaults to False.
+            workers (int, optional): If > 1, convert files in a pool of this many processes, with at most two files
+                per worker in flight. Defaults to None (sequential conversion in this process).
         """
+        if segment_hours is not None and (segment_hours <= 0 or 24 % segment_hours != 0):
+            raise ValueError("segment_hours must be a divisor of 24")
+        if compression is not None and compression not in CODECS:
+            raise ValueError(f"compression must be one of {CODECS}")
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be >= 1")
         if not os.path.exists(save_path):
             os.makedirs(save_path)
 
-        _sim = Simulation_cpp()
+        catalog = Catalog.load(save_path)
+        state = ProcessingState.load(save_path, BINS_STATE_FILE) if incremental else None
+        version = f"bins-1-segments={segment_hours}-compression={compression}"
+
+        def _written(csv_file_path, bin_file_path):
+            catalog.save()
+            key = os.path.basename(bin_file_path)
+            if incremental:
+                written = catalog.entry(bin_file_path).get("segments") or [key]
+                state.record(key, [csv_file_path], version, [os.path.join(save_path, name) for name in written])
+                state.save()
+            pbar.update(1)
+
+        jobs = []
+        for csv_file_path in csv_list:
+            filename = os.path.basename(csv_file_path)
+            bin_file_path = os.path.join(save_path, filename.replace(".csv.zip", ".bin"))
+            if incremental and catalog.entry(bin_file_path) is not None \
+                    and state.is_up_to_date(os.path.basename(bin_file_path), [csv_file_path], version):
+                continue
+            jobs.append((csv_file_path, bin_file_path))
+
         with tqdm(total=len(csv_list), desc="Writing Binaries", ncols=100, disable=not verbose) as pbar:
-            for csv_file_path in csv_list:
-                filename = os.path.basename(csv_file_path)
-                bin_file_path = os.path.join(save_path, filename.replace(".csv.zip", ".bin"))
+            pbar.update(len(csv_list) - len(jobs))
+            if workers is None or workers == 1:
+                _sim = Simulation_cpp()
+                for csv_file_path, bin_file_path in jobs:
+                    pbar.set_description(f"Currently saving binary {bin_file_path.split('/')[-1]} ... ")
+                    columns = self._load_csv(csv_file_path)
+                    self._write_order_bin(_sim, catalog, bin_file_path, columns, csv_file_path, segment_hours, compression)
+                    _written(csv_file_path, bin_file_path)
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    pending = {}
+                    queue = list(jobs)
+                    while queue or pending:
+                        while queue and len(pending) < 2 * workers:
+                            csv_file_path, bin_file_path = queue.pop(0)
+                            entry = catalog.entry(bin_file_path)
+                            names = [os.path.basename(bin_file_path)] + (entry.get("segments") or [] if entry else [])
+                            previous = {name: catalog.files[name] for name in names if name in catalog.files}
+                            future = pool.submit(self._convert_csv_to_bin, csv_file_path, bin_file_path, previous,
+                                                 segment_hours, compression)
+                            pending[future] = (csv_file_path, bin_file_path, previous)
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            csv_file_path, bin_file_path, previous = pending.pop(future)
+                            files = future.result()
+                            for name in previous:
+                                catalog.files.pop(name, None)
+                            catalog.files.update(files)
+                            pbar.set_description(f"Saved binary {bin_file_path.split('/')[-1]} ... ")
+                            _written(csv_file_path, bin_file_path)
+
+        print("\nWriting Binaries completed.")
+
+    def _synthetic_order_arrays(self, day: pd.Timestamp, orders_per_day: int, seed: int, hourly_profile,
+                                price_mean: float, price_amplitude: float, price_volatility: float, spread: float,
+                                mean_lifetime_min: float, closure_share: float, gate_open_hours: float,
+                                gate_closure_min: float, iso: bool = True):
+        """
+        Generate the order arrays of one synthetic trading day, fully vectorized.
+
+        The random state is derived from (seed, day), so every day is reproducible on its own. With iso False,
+        the sides are buy flags and the timestamps epoch milliseconds, as taken by `writeOrderBinFromArrays`.
+        """
+        if orders_per_day <= 0:
+            raise ValueError("orders_per_day must be > 0")
+        if gate_open_hours * 60 <= gate_closure_min:
+            raise ValueError("gate_open_hours must be longer than gate_closure_min")
+        if not 0 <= closure_share <= 1:
+            raise ValueError("closure_share must be in [0, 1]")
+
+        rng = np.random.RandomState([seed, day.toordinal()])
+        hour_ms = 3_600_000
+        day_ms = int(pd.Timestamp(day.date(), tz="UTC").value // 10**6)
+        gate_open_ms = int(gate_open_hours * hour_ms)
+        gate_closure_ms = int(gate_closure_min * 60_000)
+
+        # transaction times: distribute the orders over the hours of the day, uniform within each hour
+        if hourly_profile is None:
+            hourly_profile = np.ones(24)
+        hourly_profile = np.asarray(hourly_profile, dtype=np.float64)
+        if hourly_profile.shape != (24,) or (hourly_profile < 0).any() or hourly_profile.sum() <= 0:
+            raise ValueError("hourly_profile must contain 24 non-negative weights with a positive sum")
+        per_hour = rng.multinomial(orders_per_day, hourly_profile / hourly_profile.sum())
+        transaction = np.repeat(np.arange(24, dtype=np.int64) * hour_ms, per_hour)
+        transaction += rng.randint(0, hour_ms, size=orders_per_day)
+        transaction = np.sort(transaction) + day_ms
+
+        # delivery hour: uniform over the products open at transaction time
+        lead = rng.randint(gate_closure_ms, gate_open_ms + 1, size=orders_per_day)
+        start = ((transaction + lead) // hour_ms) * hour_ms
+        start = np.where(start < transaction + gate_closure_ms, start + hour_ms, start)
+
+        # prices: daily shape per delivery hour plus a random walk in trading time per product
+        delivery_hour = (start // hour_ms) % 24
+        fair = price_mean + price_amplitude * np.sin(2 * np.pi * (delivery_hour - 6) / 24)
+        order = np.lexsort((transaction, start))
+        dt_hours = np.maximum(np.diff(transaction[order], prepend=transaction[order][0]), 0) / hour_ms
+        new_product = np.ones(orders_per_day, dtype=bool)
+        new_product[1:] = start[order][1:] != start[order][:-1]
+        steps = rng.standard_normal(orders_per_day) * price_volatility * np.sqrt(dt_hours)
+        steps[new_product] = 0.0
+        walk = np.cumsum(steps)
+        walk -= walk[np.maximum.accumulate(np.where(new_product, np.arange(orders_per_day), 0))]
+        fair[order] += walk
+
+        is_buy = rng.rand(orders_per_day) < 0.5
+        offset = rng.exponential(scale=spread, size=orders_per_day)
+        price = np.round(np.where(is_buy, fair - offset, fair + offset), 2)
+        quantity = np.maximum(np.round(rng.lognormal(mean=1.0, sigma=0.8, size=orders_per_day), 1), 0.1)
+
+        # validity: either kept until gate closure or cancelled after an exponential lifetime
+        closure = start - gate_closure_ms
+        lifetime = rng.exponential(scale=mean_lifetime_min * 60_000, size=orders_per_day).astype(np.int64) + 1
+        validity = np.where(rng.rand(orders_per_day) < closure_share, closure,
+                            np.minimum(transaction + lifetime, closure))
+        validity = np.maximum(validity, transaction + 1)
+
+        ids = np.arange(orders_per_day, dtype=np.int64) + np.int64(day.toordinal()) * 10**9
+        if not iso:
+            return {"id": ids, "initial": ids, "side": is_buy, "start": start, "transaction": transaction,
+                    "validity": validity, "price": price, "quantity": quantity}
+        return {
+            "id": ids,
+            "initial": ids,
+            "side": np.where(is_buy, "BUY", "SELL"),
+            "start": _epoch_ms_to_iso(start, unit="s"),
+            "transaction": _epoch_ms_to_iso(transaction),
+            "validity": _epoch_ms_to_iso(validity),
+            "price": price,
+            "quantity": quantity,
+        }
+
+    def generate_synthetic_orders(self, date_str: str, orders_per_day: int = 100_000, seed: int = 0, **kwargs):
+        """
+        Generate one day of synthetic pre-processed order data as a DataFrame.
+
+        The output has the format of the zipped CSV files written by `parse_market_data`, so it can be
+        saved with `to_csv` or passed to `Simulation.add_df_to_orderqueue` after parsing the timestamps.
+
+        Args:
+            date_str (str): Trading day in the format "YYYY-MM-DD" (UTC).
+            orders_per_day (int, optional): Number of orders submitted on that day. Defaults to 100000.
+            seed (int, optional): Seed of the generator. Defaults to 0.
+            **kwargs: Further generator settings, see `create_synthetic_bins`.
+
+        Returns:
+            pd.DataFrame: Orders sorted by transaction time with the columns id, initial, side, start,
+                transaction, validity, price and quantity.
+        """
+        settings = dict(hourly_profile=None, price_mean=50., price_amplitude=20., price_volatility=5., spread=3.,
+                        mean_lifetime_min=10., closure_share=0.1, gate_open_hours=33., gate_closure_min=5.)
+        unknown = set(kwargs) - set(settings)
+        if unknown:
+            raise TypeError(f"Unknown generator settings: {sorted(unknown)}")
+        settings.update(kwargs)
+        arrays = self._synthetic_order_arrays(pd.Timestamp(date_str), orders_per_day, seed, **settings)
+        return pd.DataFrame(arrays)
+
+    def create_synthetic_bins(self, start_date_str: str, end_date_str: str, save_path: str,
+                              orders_per_day: int = 100_000,
+                              seed: int = 0,
+                              hourly_profile=None,
+                              price_mean: float = 50.,
+                              price_amplitude: float = 20.,
+                              price_volatility: float = 5.,
+                              spread: float = 3.,
+                              mean_lifetime_min: float = 10.,
+                              closure_share: float = 0.1,
+                              gate_open_hours: float = 33.,
+                              gate_closure_min: float = 5.,
+                              verbose: bool = True,
+                              segment_hours: int = None,
+                              compression: str = None):
+        """
+        Generate synthetic continuous-intraday order flow and save it as simulation binaries.
+
+        One binary per day (orderbook_YYYY-MM-DD.bin) is written and recorded in the directory's catalog,
+        so it can directly be used by `Simulation.run` or `Simulation.add_bin_to_orderqueue`. Orders are generated with vectorized
+        NumPy code, and every day is seeded from (seed, date), so runs are reproducible and independent
+        of the requested date range.
+
+        Args:
+            start_date_str (str): First trading day in the format "YYYY-MM-DD" (UTC).
+            end_date_str (str): Last trading day in the format "YYYY-MM-DD" (UTC, inclusive).
+            save_path (str): Directory path where the binary files should be saved.
+            orders_per_day (int, optional): Number of orders submitted per day. Defaults to 100000.
+            seed (int, optional): Seed of the generator. Defaults to 0.
+            hourly_profile (array-like, optional): 24 relative order rates per hour of the day (UTC). Defaults to uniform.
+            price_mean (float, optional): Mean price level (€/MWh). Defaults to 50.
+            price_amplitude (float, optional): Amplitude of the daily price shape over delivery hours (€/MWh). Defaults to 20.
+            price_volatility (float, optional): Volatility of each product's fair price random walk (€/MWh per sqrt(h)). Defaults to 5.
+            spread (float, optional): Mean distance of limit prices from the fair price (€/MWh). Defaults to 3.
+            mean_lifetime_min (float, optional): Mean lifetime of cancelled orders (min, exponential). Defaults to 10.
+            closure_share (float, optional): Share of orders valid until gate closure [0, 1]. Defaults to 0.1.
+            gate_open_hours (float, optional): How long before delivery a product opens for trading (h). Defaults to 33.
+            gate_closure_min (float, optional): How long before delivery a product closes for trading (min). Defaults to 5.
+            verbose (bool, optional): If True, print progress messages. Defaults to True.
+            segment_hours (int, optional): Split each day into transaction-time segments, see `create_bins_from_csv`.
+                Defaults to None.
+            compression (str, optional): Write block-compressed files, see `create_bins_from_csv`. Defaults to None.
+
+        Returns:
+            list: The paths of the written binary files (the day paths, as used by `Simulation.add_bin_to_orderqueue`).
+        """
+        if segment_hours is not None and (segment_hours <= 0 or 24 % segment_hours != 0):
+            raise ValueError("segment_hours must be a divisor of 24")
+        if compression is not None and compression not in CODECS:
+            raise ValueError(f"compression must be one of {CODECS}")
+        if not os.path.exists(save_path):
+            os.makedirs(save_path)
+
+        start_date = pd.Timestamp(start_date_str)
+        end_date = pd.Timestamp(end_date_str)
+        if start_date > end_date:
+            raise ValueError("Error: Start date is after end date.")
+
+        _sim = Simulation_cpp()
+        catalog = Catalog.load(save_path)
+        paths = []
+        dates = pd.date_range(start_date, end_date, freq="D")
+        with tqdm(total=len(dates), desc="Writing Synthetic Binaries", ncols=100, disable=not verbose) as pbar:
+            for day in dates:
+                bin_file_path = os.path.join(save_path, f"orderbook_{day.date()}.bin")
                 pbar.set_description(f"Currently saving binary {bin_file_path.split('/')[-1]} ... ")
-                ids, initials, sides, starts, transactions, validities, prices, quantities = self._load_csv(csv_file_path)
-                _sim.writeOrderBinFromPandas(
-                    bin_file_path,
-                    ids,
-                    initials,
-                    sides,
-                    starts,
-                    transactions,
-                    validities,
-                    prices,
-                    quantities,
-                )
+                # engine binaries are written from the NumPy buffers, segments and compressed files from lists
+                epoch_ms = segment_hours is None and compression is None
+                arrays = self._synthetic_order_arrays(day, orders_per_day, seed, hourly_profile, price_mean,
+                                                      price_amplitude, price_volatility, spread, mean_lifetime_min,
+                                                      closure_share, gate_open_hours, gate_closure_min, iso=not epoch_ms)
+                columns = tuple(arrays[col] if epoch_ms else arrays[col].tolist() for col in ORDER_COLUMNS)
+                self._write_order_bin(_sim, catalog, bin_file_path, columns, "synthetic", segment_hours, compression,
+                                      epoch_ms=epoch_ms)
+                catalog.save()
+                paths.append(bin_file_path)
                 pbar.update(1)
 
-        print("\nWriting Binaries completed.")
\ No newline at end of file
+        print("\nWriting synthetic binaries completed.")
+        return paths
+
+
+def _order_columns(df: pd.DataFrame):
+    """
+    Convert a DataFrame of orders to the column lists of the simulation's order queue.
+
+    Timestamps are either ISO 8601 strings in UTC, or timezone aware datetimes, which are converted to UTC
+    and formatted with seconds (start) and milliseconds (transaction, validity).
+    """
+    missing = [col for col in ORDER_COLUMNS if col not in df]
+    if missing:
+        raise ValueError(f"Orders are missing the columns {missing}")
+    columns = []
+    for col in ORDER_COLUMNS:
+        values = df[col]
+        if col in ("start", "transaction", "validity") and pd.api.types.is_datetime64_any_dtype(values):
+            if values.dt.tz is None:
+                raise ValueError("All timestamps of the orders must be timezone aware")
+            values = values.dt.tz_convert("UTC").dt.tz_localize(None)
+            if col == "start":
+                values = values.dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+            else:
+                values = values.dt.strftime("%Y-%m-%dT%H:%M:%S.%f").str[:-3] + "Z"
+        if col in ("id", "initial"):
+            columns.append(values.to_numpy(dtype=np.int64).tolist())
+        elif col in ("price", "quantity"):
+            columns.append(values.to_numpy(dtype=np.float64).tolist())
+        else:
+            columns.append(values.to_numpy(dtype="str").tolist())
+    return tuple(columns)
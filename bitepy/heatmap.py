@@ -32,12 +32,16 @@ DEFAULT_FIGWIDTH = 8
 DEFAULT_FIGHEIGHT = DEFAULT_FIGWIDTH / DEFAULT_FIGRATIO
 DEFAULT_FIGSIZE = (DEFAULT_FIGWIDTH, DEFAULT_FIGHEIGHT)
 
-plt.rcParams["figure.figsize"] = DEFAULT_FIGSIZE
-plt.rcParams["font.family"] = "sans-serif"
-plt.rcParams["font.size"] = 13
-# plt.rcParams["savefig.dpi"] = 300
-plt.rcParams["savefig.bbox"] = "tight"
-plt.rcParams["savefig.pad_inches"] = 0.02
+# Style of all bitepy plots. Applied with plt.rc_context() around plotting only,
+# so importing this module leaves the global rcParams untouched.
+RC_PARAMS = {
+    "figure.figsize": DEFAULT_FIGSIZE,
+    "font.family": "sans-serif",
+    "font.size": 13,
+    # "savefig.dpi": 300,
+    "savefig.bbox": "tight",
+    "savefig.pad_inches": 0.02,
+}
 
 
 def _datetime_from_time(time):
@@ -137,6 +141,7 @@ def HeatmapFigure(
     # TODO for some reasons setting this for the ax only does not work, so we
     # modify the global defualt for now
     # -> probably have to add it explicitpy to lacators
+    # (callers wrap this in plt.rc_context(RC_PARAMS), which restores the global default)
     # ax.xaxis_date(tz=timezone)
     # ax.yaxis_date(tz=timezone)
     # ax_histx.xaxis_date(tz=timezone)
@@ -0,0 +1,395 @@
+######################################################################
+# Copyright (C) 2025 ETH Zurich
+# BitePy: A Python Battery Intraday Trading Engine
+# Bits to Energy Lab - Chair of Information Management - ETH Zurich
+#
+# Author: David Schaurecker
+#
+# Licensed under MIT License, see https://opensource.org/license/mit
+######################################################################
+
+import itertools
+import json
+import os
+import pickle
+import socket
+import tempfile
+import threading
+import time
+import traceback
+import uuid
+
+import pandas as pd
+
+_STATES = ("pending", "running", "done", "failed")
+
+
+def run_simulation_job(params: dict):
+    """
+    Run one simulation job, the default runner of `JobQueue.work`.
+
+    Args:
+        params (dict): Job parameters with the entries:
+            - data_path (str): Directory of the order binaries.
+            - start_date, end_date (str): Simulation window, timezone aware ISO 8601 strings.
+            - simulation (dict, optional): Further keyword arguments of `Simulation`.
+            - save_logs (bool, optional): If True, the logs are returned (and pickled by the queue).
+            - solve_latency_model (str, optional): Path of a `SolveLatencyModel` to replay solve times from.
+
+    Returns:
+        dict: The result with the total reward, the run time and, if requested, the logs.
+    """
+    from .simulation import Simulation
+    from .results import Results
+    from .latency import SolveLatencyModel
+
+    sim = Simulation(pd.Timestamp(params["start_date"]), pd.Timestamp(params["end_date"]),
+                     **params.get("simulation", {}))
+    model = SolveLatencyModel.load(params["solve_latency_model"]) if params.get("solve_latency_model") else None
+    start = time.perf_counter()
+    sim.run(params["data_path"], verbose=False, solve_latency_model=model)
+    run_s = time.perf_counter() - start
+    logs = sim.get_logs()
+    result = {"reward": float(Results(logs).get_total_reward()), "run_s": run_s}
+    if params.get("save_logs"):
+        result["logs"] = logs
+    return result
+
+
+class JobQueue:
+    def __init__(self, path: str, max_attempts: int = 3):
+        """
+        Initialize a job queue on a (shared) filesystem.
+
+        Jobs are JSON files that move between the directories pending/, running/, done/ and failed/ of
+        the queue. A worker claims a job by renaming it from pending/ to running/, which is atomic, so
+        any number of processes on any number of hosts sharing the directory (e.g. over NFS) can pull
+        jobs without further coordination. Running jobs are kept alive by touching their file; jobs whose
+        worker stopped touching them are put back to pending/ by the next worker. Results are written to
+        results/.
+
+        Args:
+            path (str): The queue directory, created if it does not exist.
+            max_attempts (int, optional): How often a job is tried before it is moved to failed/. Default is 3.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        self.path = path
+        self.max_attempts = max_attempts
+        for state in _STATES + ("results",):
+            os.makedirs(os.path.join(path, state), exist_ok=True)
+
+    def _job_path(self, state: str, job_id: str):
+        return os.path.join(self.path, state, f"{job_id}.json")
+
+    def _write_json(self, file_path: str, content: dict):
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), prefix=".tmp-", suffix=".json")
+        with os.fdopen(fd, "w") as f:
+            json.dump(content, f, indent=1, default=str)
+        os.replace(tmp_path, file_path)
+
+    def _read_json(self, file_path: str):
+        with open(file_path, "r") as f:
+            return json.load(f)
+
+    def submit(self, params: dict, job_id: str = None):
+        """
+        Add a job to the queue.
+
+        Args:
+            params (dict): The job parameters, passed to the runner (see `run_simulation_job`). Must be JSON serializable.
+            job_id (str, optional): Unique id of the job. Defaults to a random id.
+
+        Returns:
+            str: The job id.
+        """
+        job_id = job_id or uuid.uuid4().hex[:12]
+        if any(os.path.exists(self._job_path(state, job_id)) for state in _STATES):
+            raise ValueError(f"Job {job_id} already exists")
+        job = {"id": job_id, "params": params, "attempts": 0, "submitted": pd.Timestamp.now(tz="UTC").isoformat(),
+               "errors": []}
+        # written outside of pending/, so workers never see partial jobs
+        tmp_path = os.path.join(self.path, "results", f".submit-{job_id}.json")
+        self._write_json(tmp_path, job)
+        os.replace(tmp_path, self._job_path("pending", job_id))
+        return job_id
+
+    def submit_sweep(self, base_params: dict, grid: dict):
+        """
+        Add one job per combination of simulation parameters.
+
+        Args:
+            base_params (dict): Parameters shared by all jobs, e.g. data_path, start_date and end_date.
+            grid (dict): Lists of values per `Simulation` keyword argument, e.g. {"num_stor_states": [11, 51]}.
+
+        Returns:
+            list: The job ids.
+        """
+        job_ids = []
+        for values in itertools.product(*grid.values()):
+            params = dict(base_params)
+            params["simulation"] = {**base_params.get("simulation", {}), **dict(zip(grid.keys(), values))}
+            job_ids.append(self.submit(params))
+        return job_ids
+
+    def claim(self, worker: str = None):
+        """
+        Claim the oldest pending job.
+
+        Args:
+            worker (str, optional): Name of the claiming worker, recorded in the job.
+
+        Returns:
+            dict: The claimed job, or None if no job is pending.
+        """
+        pending = os.path.join(self.path, "pending")
+        names = sorted((f for f in os.listdir(pending) if f.endswith(".json") and not f.startswith(".")),
+                       key=lambda f: _mtime(os.path.join(pending, f)))
+        for name in names:
+            # claim under a private name until the job is written; requeue_stale only recovers private
+            # claims that are older than its stale_s, e.g. of a worker that died while claiming
+            pending_path = os.path.join(pending, name)
+            claim_path = self._private_path("claim")
+            try:
+                # renames keep the modification time, which is the heartbeat of the job
+                os.utime(pending_path)
+                os.rename(pending_path, claim_path)
+                job = self._read_json(claim_path)
+                job["attempts"] += 1
+                job["worker"] = worker or _worker_name()
+                job["claim"] = uuid.uuid4().hex
+                job["claimed"] = pd.Timestamp.now(tz="UTC").isoformat()
+                self._write_json(claim_path, job)
+                running_path = self._job_path("running", job["id"])
+                os.rename(claim_path, running_path)
+                os.utime(running_path)
+            except FileNotFoundError:
+                continue  # claimed by another worker, or recovered from this one by requeue_stale
+            return job
+        return None
+
+    def heartbeat(self, job: dict):
+        """
+        Mark a running job as alive.
+
+        Returns False if the job is not in running/ under this worker's claim at the moment, e.g. because
+        it was requeued (and possibly claimed by another worker) or is being moved.
+        """
+        running_path = self._job_path("running", job["id"])
+        try:
+            if self._read_json(running_path).get("claim") != job.get("claim"):
+                return False
+            os.utime(running_path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def complete(self, job: dict, result: dict):
+        """
+        Store the result of a job and move it to done/.
+
+        Results are written to results/<id>.json; a "logs" entry of the result is pickled to
+        results/<id>_logs.pkl instead. They are only published if the job is still claimed by this
+        worker, else they are discarded.
+
+        Returns:
+            bool: True if the job was moved to done/, False if it was requeued in the meantime.
+        """
+        result = dict(result)
+        logs = result.pop("logs", None)
+        results = os.path.join(self.path, "results")
+        # written under private names first, published once the job is moved
+        staged = []
+        if logs is not None:
+            fd, tmp_path = tempfile.mkstemp(dir=results, prefix=".tmp-", suffix=".pkl")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(logs, f)
+            staged.append((tmp_path, os.path.join(results, f"{job['id']}_logs.pkl")))
+        tmp_path = os.path.join(results, f".result-{uuid.uuid4().hex}.json")
+        self._write_json(tmp_path, {"id": job["id"], "worker": job.get("worker"), "attempts": job["attempts"],
+                                    "finished": pd.Timestamp.now(tz="UTC").isoformat(), "params": job["params"],
+                                    **result})
+        staged.append((tmp_path, os.path.join(results, f"{job['id']}.json")))
+
+        moved = self._move(job, "done")
+        for tmp_path, path in staged:
+            if moved:
+                os.replace(tmp_path, path)
+            else:
+                os.remove(tmp_path)
+        return moved
+
+    def fail(self, job: dict, error: str):
+        """
+        Record a failed attempt, and requeue the job or move it to failed/ after max_attempts attempts.
+
+        Returns:
+            bool: True if the job was moved, False if it was requeued in the meantime.
+        """
+        job["errors"].append(error)
+        return self._move(job, "pending" if job["attempts"] < self.max_attempts else "failed")
+
+    def _private_path(self, prefix: str):
+        """A unique hidden path in running/, ignored by claim and requeue_stale."""
+        return os.path.join(self.path, "running", f".{prefix}-{uuid.uuid4().hex}.json")
+
+    def _move(self, job: dict, state: str):
+        """Move a job claimed by this worker from running/ to state. Returns False if it was requeued."""
+        running_path = self._job_path("running", job["id"])
+        try:
+            # a job requeued and claimed again by another worker is left in place
+            if self._read_json(running_path).get("claim") != job.get("claim"):
+                return False
+        except FileNotFoundError:
+            return False
+        # take the job out of running/ first, so a concurrent requeue_stale can not leave it in two states
+        move_path = self._private_path("move")
+        try:
+            os.rename(running_path, move_path)
+        except FileNotFoundError:
+            return False
+        if self._read_json(move_path).get("claim") != job.get("claim"):
+            # requeued and claimed again since the check above, give the job back to its owner
+            os.rename(move_path, running_path)
+            return False
+        self._write_json(move_path, job)
+        os.rename(move_path, self._job_path(state, job["id"]))
+        return True
+
+    def requeue_stale(self, stale_s: float):
+        """
+        Put running jobs without a heartbeat for stale_s seconds back to pending/ (or to failed/).
+
+        Jobs left under a private claim name for stale_s seconds, by a worker that stopped while claiming
+        them, are recovered the same way. stale_s must be well above the heartbeat interval and the clock
+        skew between the hosts.
+
+        Returns:
+            list: The ids of the requeued jobs.
+        """
+        requeued = []
+        running = os.path.join(self.path, "running")
+        now = time.time()
+        for name in os.listdir(running):
+            running_path = os.path.join(running, name)
+            if not name.endswith(".json") or (name.startswith(".") and not name.startswith(".claim-")) \
+                    or now - _mtime(running_path) < stale_s:
+                continue
+            # take the job out of running/ first, so only one worker requeues it
+            requeue_path = self._private_path("requeue")
+            try:
+                os.rename(running_path, requeue_path)
+            except FileNotFoundError:
+                continue
+            job = self._read_json(requeue_path)
+            job["errors"].append(f"stale: no heartbeat from {job.get('worker')} for {stale_s:.0f} s")
+            state = "pending" if job["attempts"] < self.max_attempts else "failed"
+            self._write_json(requeue_path, job)
+            os.rename(requeue_path, self._job_path(state, job["id"]))
+            requeued.append(job["id"])
+        return requeued
+
+    def status(self):
+        """Return the number of jobs per state."""
+        return {state: sum(f.endswith(".json") for f in os.listdir(os.path.join(self.path, state)))
+                for state in _STATES}
+
+    def results(self):
+        """
+        Collect the results of all finished jobs.
+
+        Returns:
+            pd.DataFrame: One row per finished job, indexed by job id, with the result entries and the
+                job parameters (simulation parameters flattened into columns).
+        """
+        rows = []
+        results = os.path.join(self.path, "results")
+        for name in sorted(os.listdir(results)):
+            if not name.endswith(".json") or name.startswith("."):
+                continue
+            result = self._read_json(os.path.join(results, name))
+            params = result.pop("params")
+            rows.append({**result, **{k: v for k, v in params.items() if k != "simulation"},
+                         **params.get("simulation", {})})
+        return pd.DataFrame(rows).set_index("id") if rows else pd.DataFrame()
+
+    def work(self, runner=None, worker: str = None, max_jobs: int = None, poll_s: float = 5.,
+             heartbeat_s: float = 30., stale_s: float = 300., wait: bool = False):
+        """
+        Process jobs until the queue is empty (or max_jobs jobs are done).
+
+        Start this on every node (or in several processes per node) that shares the queue directory.
+
+        Args:
+            runner (callable, optional): Function mapping the job parameters to a JSON serializable result
+                dict. Defaults to `run_simulation_job`.
+            worker (str, optional): Name of the worker. Defaults to host name and process id.
+            max_jobs (int, optional): Stop after this many jobs. Default is None (no limit).
+            poll_s (float, optional): Seconds between polls while waiting for jobs. Default is 5.
+            heartbeat_s (float, optional): Seconds between heartbeats of the running job. Default is 30.
+            stale_s (float, optional): Seconds without heartbeat after which jobs of other workers are requeued.
+                Default is 300.
+            wait (bool, optional): If True, keep polling while other workers still run jobs that could be
+                requeued. Default is False (stop as soon as nothing is pending).
+
+        Returns:
+            int: The number of jobs processed by this worker.
+        """
+        if heartbeat_s >= stale_s:
+            raise ValueError("heartbeat_s must be smaller than stale_s")
+        runner = runner or run_simulation_job
+        worker = worker or _worker_name()
+        processed = 0
+        while max_jobs is None or processed < max_jobs:
+            self.requeue_stale(stale_s)
+            job = self.claim(worker)
+            if job is None:
+                if wait and self.status()["running"] > 0:
+                    time.sleep(poll_s)
+                    continue
+                break
+
+            stop = threading.Event()
+
+            def _beat():
+                # a missed beat (e.g. while another worker checks the job) is retried on the next one
+                while not stop.wait(heartbeat_s):
+                    self.heartbeat(job)
+
+            beat = threading.Thread(target=_beat, name="bitepy-job-heartbeat", daemon=True)
+            beat.start()
+            try:
+                result = runner(job["params"])
+            except Exception:
+                stop.set()
+                beat.join()
+                self.fail(job, traceback.format_exc())
+            else:
+                stop.set()
+                beat.join()
+                self.complete(job, result)
+            processed += 1
+        return processed
+
+
+def _mtime(file_path: str):
+    try:
+        return os.path.getmtime(file_path)
+    except FileNotFoundError:
+        return float("inf")
+
+
+def _worker_name():
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Process bitepy simulation jobs from a shared job queue directory.")
+    parser.add_argument("queue", help="the queue directory")
+    parser.add_argument("--max-jobs", type=int, default=None, help="stop after this many jobs")
+    parser.add_argument("--stale-s", type=float, default=300., help="requeue jobs without heartbeat for this long")
+    parser.add_argument("--wait", action="store_true", help="keep polling while other workers run jobs")
+    args = parser.parse_args()
+    JobQueue(args.queue).work(max_jobs=args.max_jobs, stale_s=args.stale_s, wait=args.wait)
@@ -0,0 +1,137 @@
+######################################################################
+# Copyright (C) 2025 ETH Zurich
+# BitePy: A Python Battery Intraday Trading Engine
+# Bits to Energy Lab - Chair of Information Management - ETH Zurich
+#
+# Author: David Schaurecker
+#
+# Licensed under MIT License, see https://opensource.org/license/mit
+######################################################################
+
+import json
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+MODEL_VERSION = 1
+# levels of the stored quantile functions
+QUANTILE_LEVELS = tuple(np.round(np.linspace(0., 1., 21), 2))
+
+
+class SolveLatencyModel:
+    def __init__(self, seed: int = 0, per_day_draw: bool = False):
+        """
+        Initialize an (empty) model of the DP solve latency, to replay realistic solve times deterministically.
+
+        The model stores, per number of storage states, the quantile function of the solve latencies
+        observed in calibration runs with `fixed_solve_time=-1`. Passed to `Simulation.run`, it sets the
+        fixed solve time of every simulated day to the median latency, so results no longer depend on
+        the load of the machine and simulations can run in parallel.
+
+        The engine takes one fixed solve time for all solves of a day, so the spread of the per-solve
+        latencies can not be reproduced. With per_day_draw, each day gets its own draw from the
+        distribution, seeded by (seed, day): the draw is per day, not per solve, so all solves of a day
+        share it and the solve times vary between days only.
+
+        Args:
+            seed (int, optional): Seed of the per-day draws. Default is 0.
+            per_day_draw (bool, optional): If True, draw one latency per simulated day instead of using the
+                median. Default is False.
+        """
+        self.seed = seed
+        self.per_day_draw = per_day_draw
+        self.quantiles = {}
+        self.samples = {}
+
+    def add(self, logs: dict, num_stor_states: int, tec_delay: int = 0):
+        """
+        Add the solve latencies of a calibration run.
+
+        The latency of a DP solve is taken from the orders it sent: the time from the start of the solve
+        (last_solve_time) to the first of its orders at the exchange, minus the technical delay.
+        Repeated calls for the same number of storage states pool the samples.
+
+        Args:
+            logs (dict): The `Simulation.get_logs` output of a run with fixed_solve_time=-1.
+            num_stor_states (int): The number of storage states of the run.
+            tec_delay (int, optional): The technical delay of the run (ms). Default is 0.
+
+        Returns:
+            int: The number of solves added.
+        """
+        orders = [logs[key][["dp_run", "time", "last_solve_time"]] for key in ("executed_orders", "killed_orders")
+                  if key in logs and not logs[key].empty]
+        if not orders:
+            return 0
+        orders = pd.concat(orders, ignore_index=True)
+        delay_ms = (orders["time"] - orders["last_solve_time"]).dt.total_seconds() * 1000. - tec_delay
+        latencies = delay_ms.groupby(orders["dp_run"]).min().clip(lower=0.).to_numpy()
+
+        key = str(int(num_stor_states))
+        known = self.samples.get(key, 0)
+        if known:
+            # pool with the stored distribution, weighted by the number of samples
+            stored = np.interp(np.linspace(0., 1., known), QUANTILE_LEVELS, self.quantiles[key])
+            latencies = np.concatenate([stored, latencies])
+        self.quantiles[key] = np.quantile(latencies, QUANTILE_LEVELS).tolist()
+        self.samples[key] = int(len(latencies))
+        return len(latencies) - known
+
+    def latency_ms(self, num_stor_states: int, day: pd.Timestamp = None):
+        """
+        Return the solve latency to simulate.
+
+        For state counts without calibration data, the median latencies of the calibrated state counts
+        are extrapolated with a power law in the number of states (quadratic if only one is calibrated).
+
+        Args:
+            num_stor_states (int): The number of storage states of the simulation.
+            day (pd.Timestamp, optional): The simulated day. If given and the model has per_day_draw set,
+                the latency is a draw from the distribution seeded by (seed, day), shared by all solves of
+                the day; else the median.
+
+        Returns:
+            int: The solve latency (ms).
+        """
+        if not self.quantiles:
+            raise ValueError("The solve latency model has no calibration data")
+        level = 0.5
+        if self.per_day_draw and day is not None:
+            level = np.random.default_rng([self.seed, pd.Timestamp(day).toordinal()]).random()
+
+        key = str(int(num_stor_states))
+        if key in self.quantiles:
+            return int(round(np.interp(level, QUANTILE_LEVELS, self.quantiles[key])))
+
+        states = np.array(sorted(int(k) for k in self.quantiles))
+        medians = np.array([np.interp(0.5, QUANTILE_LEVELS, self.quantiles[str(s)]) for s in states])
+        nearest = states[np.argmin(np.abs(np.log(states) - np.log(num_stor_states)))]
+        exponent = 2.
+        if len(states) > 1 and np.all(medians > 0):
+            exponent = np.polyfit(np.log(states), np.log(medians), 1)[0]
+        scale = (num_stor_states / nearest) ** exponent
+        return int(round(np.interp(level, QUANTILE_LEVELS, self.quantiles[str(nearest)]) * scale))
+
+    def save(self, file_path: str):
+        """Write the model atomically to a JSON file."""
+        content = {"version": MODEL_VERSION, "seed": self.seed, "per_day_draw": self.per_day_draw, "levels": list(QUANTILE_LEVELS),
+                   "quantiles": self.quantiles, "samples": self.samples}
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(file_path)), prefix=".latency-",
+                                        suffix=".json")
+        with os.fdopen(fd, "w") as f:
+            json.dump(content, f, indent=1)
+        os.replace(tmp_path, file_path)
+
+    @classmethod
+    def load(cls, file_path: str):
+        """Load a model written by `save`."""
+        with open(file_path, "r") as f:
+            content = json.load(f)
+        if content.get("version") != MODEL_VERSION or content.get("levels") != list(QUANTILE_LEVELS):
+            raise ValueError(f"Unsupported solve latency model in {file_path}")
+        model = cls(seed=content["seed"], per_day_draw=content.get("per_day_draw", False))
+        model.quantiles = content["quantiles"]
+        model.samples = content["samples"]
+        return model
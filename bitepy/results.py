@@ -10,8 +10,19 @@
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from . import heatmap as hm
+
+
+def _plotting():
+    """
+    Import the plotting stack on first use, so that `import bitepy` does not load matplotlib.
+
+    Returns:
+        tuple: The matplotlib.pyplot and bitepy.heatmap modules.
+    """
+    import matplotlib.pyplot as plt
+    from . import heatmap as hm
+    return plt, hm
+
 
 class Results:
     def __init__(self, logs: dict):
@@ -25,6 +36,8 @@ class Results:
         self.logs = logs
 
     def get_total_reward(self):
+        if self.logs["decision_record"].empty:
+            return 0.
         return np.round(self.logs["decision_record"]['real_reward'].sum(),2)
     
     def plot_decision_chart(self,lleft: int = 0,lright: int = -1):
@@ -35,6 +48,11 @@ class Results:
             lleft (int): The left index of the simulation period.
             lright (int): The right index of the simulation period.
         """
+        plt, hm = _plotting()
+        with plt.rc_context(hm.RC_PARAMS):
+            self._plot_decision_chart(plt, lleft, lright)
+
+    def _plot_decision_chart(self, plt, lleft: int, lright: int):
         df = self.logs["decision_record"]
 
         # plot storage, position, and reward where reward is in a seperate axis below
@@ -77,7 +95,11 @@ class Results:
         Plot a heatmap of the final storage positions and visualize the executed orders over the simulation period.
         Heatmap plots adapted from: https://github.com/bitstoenergy/iclr-smartmeteranalytics by Markus Kreft.
         """
+        plt, hm = _plotting()
+        with plt.rc_context(hm.RC_PARAMS):
+            self._plot_heatmap(plt, hm)
 
+    def _plot_heatmap(self, plt, hm):
         df = self.logs["decision_record"]
         df.index = df["hour"]
         df = df.drop(columns=["hour"])
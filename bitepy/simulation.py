@@ -8,12 +8,31 @@
 # Licensed under MIT License, see https://opensource.org/license/mit
 ######################################################################
 
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
 import numpy as np
 import pytz
 from datetime import timedelta
 from tqdm import tqdm
 
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+from .catalog import Catalog
+from .compression import COMPRESSED_SUFFIX, read_compressed_header, read_compressed_orders
+from .data import _order_columns
+from .results import Results
+from .streaming import OrderStream
+
 try:
     from ._bite import Simulation_cpp
 except ImportError as e:
@@ -21,6 +40,89 @@ except ImportError as e:
         "Failed to import _bite module. Ensure that the C++ extension is correctly built and installed."
     ) from e
 
+class _ProgressMonitor:
+    """
+    Report simulation progress to a user callback at day boundaries and, from a background
+    thread, every `interval_s` seconds while the engine runs (the engine releases the GIL).
+
+    The engine state can not be read while a day is running, so the heartbeats only refresh at day
+    boundaries: they repeat the simulated time, storage and throughput of the last finished day, and
+    only the elapsed times advance.
+    """
+    def __init__(self, callback, interval_s, num_days: int):
+        self._callback = callback
+        self._interval_s = interval_s
+        self._num_days = num_days
+        self._state_lock = threading.Lock()
+        self._callback_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._t_run = time.perf_counter()
+        self._t_day = self._t_run
+        self._day_index = 0
+        self._file = None
+        self._days_done = 0
+        self._mb_done = 0.
+        self._orders_done = 0
+        # last finished day, repeated by the heartbeats
+        self._simulated_until = None
+        self._storage = None
+        self.stop_requested = False
+
+    def __enter__(self):
+        if self._callback is not None and self._interval_s is not None and self._interval_s > 0:
+            self._thread = threading.Thread(target=self._heartbeat, name="bitepy-progress", daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def start_day(self, day_index: int, path: str):
+        with self._state_lock:
+            self._day_index = day_index
+            self._file = os.path.basename(path)
+            self._t_day = time.perf_counter()
+
+    def end_day(self, simulated_until: pd.Timestamp, storage, orders, file_mb: float):
+        if self._callback is None:
+            return
+        with self._state_lock:
+            self._days_done += 1
+            self._mb_done += file_mb
+            self._orders_done = self._orders_done + orders if orders is not None and self._orders_done is not None else None
+            self._simulated_until = simulated_until
+            self._storage = storage
+        self._report("day_finished")
+
+    def _heartbeat(self):
+        while not self._stop.wait(self._interval_s):
+            self._report("heartbeat")
+
+    def _report(self, event: str):
+        now = time.perf_counter()
+        with self._state_lock:
+            elapsed = now - self._t_run
+            progress = {
+                "event": event,
+                "day_index": self._day_index,
+                "num_days": self._num_days,
+                "file": self._file,
+                "simulated_until": self._simulated_until,
+                "storage": self._storage,
+                "elapsed_s": elapsed,
+                "day_elapsed_s": now - self._t_day,
+                "days_per_s": self._days_done / elapsed if elapsed > 0 else np.nan,
+                "mb_per_s": self._mb_done / elapsed if elapsed > 0 else np.nan,
+                "orders_per_s": self._orders_done / elapsed if elapsed > 0 and self._orders_done is not None else np.nan,
+            }
+        with self._callback_lock:
+            if self._callback(progress) is False:
+                self.stop_requested = True
+
+
 class Simulation:
     def __init__(self, start_date: pd.Timestamp, end_date: pd.Timestamp,
                  storage_max=10.,
@@ -91,6 +193,11 @@ class Simulation:
         #     raise ValueError("forecast_horizon_start must larger than forecast_horizon_end")
         
         self._sim_cpp = Simulation_cpp()
+        # keyword arguments of the constructor, to create simulations of other windows (see run_parallel)
+        self._kwargs = dict(storage_max=storage_max, lin_deg_cost=lin_deg_cost, loss_in=loss_in, loss_out=loss_out,
+                            trading_fee=trading_fee, num_stor_states=num_stor_states, tec_delay=tec_delay,
+                            fixed_solve_time=fixed_solve_time, solve_frequency=solve_frequency,
+                            withdraw_max=withdraw_max, inject_max=inject_max)
 
         self._sim_cpp.params.storageMax = storage_max
         self._sim_cpp.params.linDegCost = lin_deg_cost
@@ -124,52 +231,57 @@ class Simulation:
         self._sim_cpp.params.endYear = end_date.year
         self._sim_cpp.params.endHour = end_date.hour
 
-    def add_bin_to_orderqueue(self, bin_data: str):
+        self._profiling = False
+        self._profile_records = []
+        self._profile_get_logs_s = 0.
+        self._queued_mb = 0.
+        self._engine_lock = None
+        # serializes the engine calls of the async methods' executor threads and of an order stream
+        self._engine_calls = threading.Lock()
+
+    def add_bin_to_orderqueue(self, bin_data: str, start: pd.Timestamp = None, end: pd.Timestamp = None):
         """
         Add an order binary file to the simulation's order queue.
 
+        Days written as transaction-time segments or block-compressed files (see `Data.create_bins_from_csv`)
+        are resolved through the catalog of the file's directory and their files are added in order.
+
         Args:
             bin_data (str): The path to the order binary file.
+            start (pd.Timestamp, optional): Only add segments with orders still valid after this time (timezone aware).
+            end (pd.Timestamp, optional): Only add segments with orders submitted before this time (timezone aware).
         """
-        self._sim_cpp.addOrderQueueFromBin(bin_data)
+        if os.path.exists(bin_data) and start is None and end is None:
+            self._add_order_file(bin_data)
+            return
+        self._add_planned_bins(Catalog.load(os.path.dirname(bin_data)).plan([bin_data], start, end)[0])
+
+    def _add_planned_bins(self, parts: list):
+        for path, _ in parts:
+            self._add_order_file(path)
+
+    def _add_order_file(self, path: str):
+        if path.endswith(COMPRESSED_SUFFIX):
+            self._sim_cpp.addOrderQueueFromPandas(*read_compressed_orders(path))
+        else:
+            self._sim_cpp.addOrderQueueFromBin(path)
+        self._queued_mb += _queue_mb([(path, None)])
     
     def add_df_to_orderqueue(self, df: pd.DataFrame):
         """
         Add a DataFrame of orders to the simulation's order queue.
 
-        The DataFrame must have the same columns as the saved CSV files, with timestamps in UTC
-        (seconds and milliseconds).
+        The DataFrame must have the same columns as the saved CSV files, with timezone aware timestamps
+        (or ISO 8601 strings in UTC), which are passed to the engine in UTC (seconds and milliseconds).
 
         Args:
-            df (pd.DataFrame): A DataFrame containing the orders to be added.
+            df (pd.DataFrame): A DataFrame containing the orders to be added. It is not modified.
+        """
+        self._add_order_columns(_order_columns(df))
 
-        Processing Steps:
-            - Validate that the timestamp columns ('start', 'transaction', 'validity') are timezone aware.
-            - Ensure that all timestamps are in the same timezone.
-            - Convert all timestamps to UTC and format them in ISO 8601.
-        """
-        if (df["start"].dt.tz is None and df["transaction"].dt.tz is None and df["validity"].dt.tz is None):
-            raise ValueError("All timestamps of input df must be timezone aware")
-        if not (df["start"].dt.tz == df["transaction"].dt.tz and df["start"].dt.tz == df["validity"].dt.tz):
-            raise ValueError("All timestamps of input df must be in the same timezone")
-        
-        df["start"] = df["start"].dt.tz_convert("UTC")
-        df["transaction"] = df["transaction"].dt.tz_convert("UTC")
-        df["validity"] = df["validity"].dt.tz_convert("UTC")
-        df["start"] = df["start"].dt.tz_localize(None).dt.strftime('%Y-%m-%dT%H:%M:%SZ')
-        df["transaction"] = df["transaction"].dt.tz_localize(None).dt.strftime('%Y-%m-%dT%H:%M:%S.%f').str[:-3] + 'Z'
-        df["validity"] = df["validity"].dt.tz_localize(None).dt.strftime('%Y-%m-%dT%H:%M:%S.%f').str[:-3] + 'Z'
-
-        ids = df['id'].to_numpy(dtype=np.int64).tolist()
-        initials = df['initial'].to_numpy(dtype=np.int64).tolist()
-        sides = df['side'].to_numpy(dtype='str').tolist()
-        starts = df['start'].to_numpy(dtype='str').tolist()
-        transactions = df['transaction'].to_numpy(dtype='str').tolist()
-        validities = df['validity'].to_numpy(dtype='str').tolist()
-        prices = df['price'].to_numpy(dtype=np.float64).tolist()
-        quantities = df['quantity'].to_numpy(dtype=np.float64).tolist()
-
-        self._sim_cpp.addOrderQueueFromPandas(ids, initials, sides, starts, transactions, validities, prices, quantities)
+    def _add_order_columns(self, columns: tuple):
+        self._sim_cpp.addOrderQueueFromPandas(*columns)
+        self._queued_mb += len(columns[0]) * _ORDER_BYTES / 1024**2
 
     # def add_forecast_from_df(self, df: pd.DataFrame):
     #     """
@@ -234,20 +346,183 @@ class Simulation:
             current_date += timedelta(days=1)
         return paths
     
-    def run(self, data_path: str, verbose: bool = True):
+    def run(self, data_path: str, verbose: bool = True, progress_callback=None, callback_interval_s: float = 10.,
+            prune: bool = True, solve_latency_model=None, memory_budget_mb: float = None):
         """
         Execute the simulation using binary data files.
 
-        The files must be named as: orderbook_YYYY-MM-DD.bin.
+        The files must be named as: orderbook_YYYY-MM-DD.bin. All files are checked before the simulation
+        starts; if the directory has a catalog (see `Catalog`), their sizes are validated against it as well.
 
         Args:
             data_path (str): The directory containing the binary data files.
             verbose (bool, optional): If True, display progress logs. Default is True.
+            progress_callback (callable, optional): Called with a progress dict after every simulated day
+                (event "day_finished") and every `callback_interval_s` seconds while a day is running
+                (event "heartbeat"). The dict holds the keys event, day_index, num_days, file,
+                simulated_until (UTC) and storage (MWh) as of the last finished day (None before it), elapsed_s,
+                day_elapsed_s, days_per_s, mb_per_s and orders_per_s (order data throughput of the finished
+                days, orders/s needs a catalog). Heartbeats only refresh these values at day boundaries, just
+                the elapsed times advance within a day. Returning False stops the simulation after the current
+                day; the engine is then finalized as after the last day. Default is None.
+            callback_interval_s (float, optional): Seconds between heartbeat calls, None or 0 to only report
+                finished days. Default is 10.
+            prune (bool, optional): If True and the directory has a catalog, skip files (or day segments) whose
+                orders were all submitted after the simulation end or all expired before its start. Default is True.
+            solve_latency_model (SolveLatencyModel, optional): If given, the fixed solve time of every day is
+                set to the model's latency for the number of storage states (the median, or with per_day_draw
+                a seeded draw per day, shared by all solves of the day), replacing measured solve times.
+                Default is None.
+            memory_budget_mb (float, optional): If given, the resident memory is checked before loading and
+                after running each day, and a MemoryError with a breakdown (see `memory_usage`) is raised
+                as soon as the budget is, or would be, exceeded, instead of the process being killed by the
+                operating system. Default is None.
 
         Processing Steps:
             - Retrieve the list of binary file paths for the simulation period.
             - Iterate through each day's data, add the file to the order queue, and run the simulation for that day.
         """
+        start_date, end_date, days = self._plan_days(data_path, prune)
+
+        num_days = len(days)
+        print("The simulation will iterate over", num_days, "files.")
+
+        monitor = _ProgressMonitor(progress_callback, callback_interval_s, num_days)
+        with monitor, self._keep_fixed_solve_time(), tqdm(total=num_days, desc="Simulated Days", unit="%", ncols=120, disable=not verbose) as pbar:
+            for i, (offset, path, parts) in enumerate(days):
+                pbar.set_description(f"Currently simulating {path.split('/')[-1]} ... ")
+                entries = [entry for _, entry in parts]
+                orders = sum(entry["orders"] for entry in entries) if None not in entries else None
+                file_mb = sum(os.path.getsize(part_path) for part_path, _ in parts) / 1024**2
+                monitor.start_day(i, path)
+                if memory_budget_mb is not None:
+                    self._check_memory_budget(memory_budget_mb, _queue_mb(parts), path)
+                t_start = time.perf_counter()
+                self._add_planned_bins(parts)
+                t_loaded = time.perf_counter()
+                if solve_latency_model is not None:
+                    day = start_date.normalize() + timedelta(days=offset)
+                    self._sim_cpp.params.fixedSolveTime = solve_latency_model.latency_ms(
+                        self._sim_cpp.params.numStorStates, day)
+                self.run_one_day(i == num_days - 1)
+                if self._profiling:
+                    self._record_profile(path, orders, file_mb, t_loaded - t_start, time.perf_counter() - t_loaded)
+                pbar.update(1)
+                if memory_budget_mb is not None:
+                    self._check_memory_budget(memory_budget_mb)
+                if progress_callback is not None:
+                    day_end = start_date.normalize() + timedelta(days=offset + 1)
+                    monitor.end_day(min(day_end, end_date), self._sim_cpp.getLastStorage(), orders, file_mb)
+                if monitor.stop_requested and i < num_days - 1:
+                    self.run_one_day(True)
+                    print("Simulation stopped by the progress callback after", i + 1, "of", num_days, "files.")
+                    return
+
+        print("Simulation finished.")
+        
+    @contextlib.contextmanager
+    def _keep_fixed_solve_time(self):
+        # a solve latency model overwrites the fixed solve time per day, restore the user's setting afterwards
+        fixed_solve_time = self._sim_cpp.params.fixedSolveTime
+        try:
+            yield
+        finally:
+            self._sim_cpp.params.fixedSolveTime = fixed_solve_time
+
+    def _plan_days(self, data_path: str, prune: bool):
+        """Return the window and the (day offset, day path, files to load) of the days that can affect it."""
+        start_date, end_date = self._get_window()
+        lob_paths = self.get_data_bins_for_each_day(data_path, start_date, end_date)
+        plan = Catalog.load(data_path).plan(lob_paths, start_date if prune else None, end_date if prune else None)
+        days = [(offset, path, parts) for offset, (path, parts) in enumerate(zip(lob_paths, plan)) if parts]
+        return start_date, end_date, days
+
+    def _async_lock(self):
+        # created on first use, inside the event loop; serializes the engine calls of the async methods
+        if self._engine_lock is None:
+            self._engine_lock = asyncio.Lock()
+        return self._engine_lock
+
+    async def _in_executor(self, executor, func, *args):
+        """Run a blocking call in the executor; if cancelled, wait for it, as the engine can not be interrupted."""
+        future = asyncio.get_running_loop().run_in_executor(executor, self._call_engine, func, *args)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            await asyncio.wait([future])
+            raise
+
+    def _run_planned_day(self, parts: list, is_last: bool):
+        self._add_planned_bins(parts)
+        self.run_one_day(is_last)
+        return self._sim_cpp.getLastStorage()
+
+    def _call_engine(self, func, *args):
+        with self._engine_calls:
+            return func(*args)
+
+    async def run_days_async(self, data_path: str, prune: bool = True, executor=None):
+        """
+        Run the simulation without blocking the event loop, yielding after every simulated day.
+
+        Loading and running each day happen in the executor, and the engine releases the GIL while it
+        works, so the event loop and other simulations keep running. Stop the iteration (or cancel the
+        consuming task) to cancel the simulation: the day currently running is finished first. The engine
+        is only locked while a day is loaded and run, not while the consumer handles a yielded day, so
+        other async calls on this simulation (e.g. `get_logs_async`) never wait for an abandoned iteration.
+
+        Args:
+            data_path (str): The directory containing the binary data files, see `run`.
+            prune (bool, optional): Skip files whose orders can not affect the window, see `run`. Default is True.
+            executor (concurrent.futures.Executor, optional): Executor of the blocking calls. Defaults to the
+                event loop's default thread pool; pass a larger thread pool to run many simulations at once.
+
+        Yields:
+            dict: Progress after each day with the keys day_index, num_days, file, simulated_until (UTC),
+                storage (MWh) and day_elapsed_s.
+        """
+        lock = self._async_lock()
+        async with lock:
+            start_date, end_date, days = await self._in_executor(executor, self._plan_days, data_path, prune)
+        for i, (offset, path, parts) in enumerate(days):
+            t_start = time.perf_counter()
+            async with lock:
+                storage = await self._in_executor(executor, self._run_planned_day, parts, i == len(days) - 1)
+            day_end = start_date.normalize() + timedelta(days=offset + 1)
+            yield {
+                "day_index": i,
+                "num_days": len(days),
+                "file": path,
+                "simulated_until": min(day_end, end_date),
+                "storage": storage,
+                "day_elapsed_s": time.perf_counter() - t_start,
+            }
+
+    async def run_async(self, data_path: str, prune: bool = True, executor=None):
+        """
+        Awaitable counterpart of `run`, see `run_days_async`.
+
+        Returns:
+            int: The number of simulated days.
+        """
+        num_days = 0
+        async for _ in self.run_days_async(data_path, prune=prune, executor=executor):
+            num_days += 1
+        return num_days
+
+    async def add_bin_to_orderqueue_async(self, bin_data: str, start: pd.Timestamp = None, end: pd.Timestamp = None,
+                                          executor=None):
+        """Awaitable counterpart of `add_bin_to_orderqueue`, running in the executor (see `run_days_async`)."""
+        async with self._async_lock():
+            await self._in_executor(executor, self.add_bin_to_orderqueue, bin_data, start, end)
+
+    async def get_logs_async(self, executor=None):
+        """Awaitable counterpart of `get_logs`, running in the executor (see `run_days_async`)."""
+        async with self._async_lock():
+            return await self._in_executor(executor, self.get_logs)
+
+    def _get_window(self):
+        """Return the simulated window [start, end) in UTC."""
         start_date = pd.Timestamp(year=self._sim_cpp.params.startYear,
                                   month=self._sim_cpp.params.startMonth,
                                   day=self._sim_cpp.params.startDay,
@@ -258,20 +533,85 @@ class Simulation:
                                 day=self._sim_cpp.params.endDay,
                                 hour=self._sim_cpp.params.endHour,
                                 tz="UTC")
-        lob_paths = self.get_data_bins_for_each_day(data_path, start_date, end_date)
+        return start_date, end_date
 
-        num_days = len(lob_paths)
-        print("The simulation will iterate over", num_days, "files.")
+    def run_parallel(self, data_path: str, chunk_days: int = 7, warmup_days: int = 1, workers: int = None,
+                     compare_sequential: bool = False, verbose: bool = True):
+        """
+        Approximate the simulation by simulating chunks of the window in parallel processes.
 
-        with tqdm(total=num_days, desc="Simulated Days", unit="%", ncols=120, disable=not verbose) as pbar:
-            for i, path in enumerate(lob_paths):
-                pbar.set_description(f"Currently simulating {path.split('/')[-1]} ... ")
-                self.add_bin_to_orderqueue(path)
-                self.run_one_day(i == len(lob_paths) - 1)
-                pbar.update(1)
+        The window is split into day-aligned chunks of `chunk_days` days. Each chunk is simulated by its own
+        `Simulation` with the parameters of this instance, starting `warmup_days` days before the chunk, so
+        that the storage level at the chunk start is the result of trading rather than the initial level.
+        The logs of the chunks are stitched by delivery time: each chunk contributes the delivery hours (and
+        the orders for them) in [chunk start, chunk end). The storage levels of two chunks at their common
+        boundary differ if the warm-up was too short, which is reported as the stitching gap.
+
+        This instance is not run, its `get_logs` is unaffected.
+
+        Args:
+            data_path (str): The directory containing the binary data files.
+            chunk_days (int, optional): Number of days per chunk. Default is 7.
+            warmup_days (int, optional): Number of days simulated before each chunk (except the first) and
+                discarded. Default is 1.
+            workers (int, optional): Number of processes. Defaults to the number of CPUs.
+            compare_sequential (bool, optional): If True, also run the exact sequential simulation (in one
+                more process) and report the reward gap. Default is False.
+            verbose (bool, optional): If True, display progress logs. Default is True.
+
+        Returns:
+            dict: A dictionary with the keys:
+                - logs: The stitched logs, as returned by `get_logs`.
+                - chunks: pd.DataFrame with one row per chunk: start, end, warmup_start, reward, the storage
+                  at the chunk start of this chunk (start_storage) and of the previous chunk
+                  (previous_end_storage), the stitching gap (MWh) and the run time (run_s).
+                - reward: The total reward of the stitched logs.
+                - sequential_reward, reward_gap: Reward of the sequential simulation and the difference
+                  reward - sequential_reward (only if compare_sequential is True).
+        """
+        if chunk_days < 1:
+            raise ValueError("chunk_days must be >= 1")
+        if warmup_days < 0:
+            raise ValueError("warmup_days must be >= 0")
+        start_date, end_date = self._get_window()
+        bounds = [start_date]
+        boundary = start_date.normalize() + timedelta(days=chunk_days)
+        while boundary < end_date:
+            bounds.append(boundary)
+            boundary += timedelta(days=chunk_days)
+        bounds.append(end_date)
+        chunks = [(max(start_date, lo - timedelta(days=warmup_days)), lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+        if verbose:
+            print("The simulation will run", len(chunks), "chunks in parallel.")
+        results = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_run_window, data_path, self._kwargs, *chunk): i for i, chunk in enumerate(chunks)}
+            if compare_sequential:
+                futures[pool.submit(_run_window, data_path, self._kwargs, start_date, start_date, end_date)] = None
+            with tqdm(total=len(futures), desc="Simulated Chunks", unit="chunk", ncols=120, disable=not verbose) as pbar:
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+                    pbar.update(1)
+
+        rows = []
+        for i, (warmup_start, lo, hi) in enumerate(chunks):
+            result = results[i]
+            previous_end = results[i - 1]["end_storage"] if i > 0 else np.nan
+            rows.append({"start": lo, "end": hi, "warmup_start": warmup_start, "reward": result["reward"],
+                         "start_storage": result["start_storage"], "previous_end_storage": previous_end,
+                         "stitching_gap": abs(result["start_storage"] - previous_end), "run_s": result["run_s"]})
+        logs = {key: pd.concat([results[i]["logs"][key] for i in range(len(chunks))], ignore_index=True)
+                for key in results[0]["logs"]}
+
+        report = {"logs": logs, "chunks": pd.DataFrame(rows), "reward": float(Results(logs).get_total_reward())}
+        if compare_sequential:
+            report["sequential_reward"] = results[None]["reward"]
+            report["reward_gap"] = report["reward"] - report["sequential_reward"]
+        if verbose:
+            print("\nParallel simulation completed.")
+        return report
 
-        print("Simulation finished.")
-        
     def run_one_day(self, is_last: bool):
         """
         Run the simulation for a single day.
@@ -283,6 +623,51 @@ class Simulation:
             - Execute the simulation for the provided day's data.
         """
         self._sim_cpp.run(is_last)
+        self._queued_mb = 0.
+
+    def open_stream(self):
+        """
+        Feed this simulation with pushed order batches instead of order files, see `OrderStream`.
+
+        Returns:
+            OrderStream: The order stream of the simulation.
+        """
+        return OrderStream(self)
+
+    def memory_usage(self):
+        """
+        Report the memory used by the simulation, broken down by component.
+
+        Log and queue sizes are estimates from record counts and file sizes, the engine does not report
+        its allocations. Converting the logs with `get_logs` needs several times their engine size.
+
+        Returns:
+            dict: A dictionary with the keys:
+                - rss_mb: Resident memory of the process (MB, NaN where /proc is not available).
+                - order_queue_mb: Estimated size of the orders added since the last `run_one_day` (MB).
+                - logs_mb: Estimated size of all engine logs (MB).
+                - log_<name>_mb: Estimated size of each engine log (MB).
+                - log_records: Number of records in all engine logs.
+                - other_mb: The rest of the resident memory (MB): the open order books, the DP, and the
+                  Python interpreter with its objects.
+        """
+        sizes = self._sim_cpp.getLogSizes()
+        report = {"rss_mb": _current_rss_mb(), "order_queue_mb": self._queued_mb}
+        log_mb = {name: count * _LOG_RECORD_BYTES.get(name, _ORDER_BYTES) / 1024**2 for name, count in sizes.items()}
+        report["logs_mb"] = sum(log_mb.values())
+        report.update({f"log_{name}_mb": mb for name, mb in log_mb.items()})
+        report["log_records"] = int(sum(sizes.values()))
+        report["other_mb"] = report["rss_mb"] - report["order_queue_mb"] - report["logs_mb"]
+        return report
+
+    def _check_memory_budget(self, budget_mb: float, next_mb: float = 0., next_file: str = None):
+        usage = self.memory_usage()
+        if np.isnan(usage["rss_mb"]) or usage["rss_mb"] + next_mb <= budget_mb:
+            return
+        when = f"before loading {os.path.basename(next_file)} ({next_mb:.0f} MB)" if next_file else "after the day"
+        breakdown = ", ".join(f"{key} {usage[key]:.0f} MB" for key in ("rss_mb", "order_queue_mb", "logs_mb", "other_mb"))
+        raise MemoryError(f"Memory budget of {budget_mb:.0f} MB exceeded {when}: {breakdown}. Simulate a shorter "
+                          f"window, or split it with run_parallel and a smaller chunk_days.")
 
     def get_logs(self):
         """
@@ -298,6 +683,7 @@ class Simulation:
         """
         # - forecast_orders: Orders virtually traded against the forecast.
         # - balancing_orders: Orders that would have incurred payments to the TSO.
+        t_start = time.perf_counter()
         decision_record, price_record, accepted_orders, executed_orders, forecast_orders, killed_orders, balancing_orders = self._sim_cpp.getLogs()
         decision_record = pd.DataFrame(decision_record)
         price_record = pd.DataFrame(price_record)
@@ -341,7 +727,102 @@ class Simulation:
             "killed_orders": pd.DataFrame(killed_orders, index=None),
             # "balancing_orders": pd.DataFrame(balancing_orders, index=None), # removed for later versions of the code
         }
+        if self._profiling:
+            self._profile_get_logs_s += time.perf_counter() - t_start
         return logs
+
+    def enable_profiling(self, enabled: bool = True):
+        """
+        Enable or disable the collection of per-day profiling data in `run`.
+
+        When disabled (the default), `run` only pays for two timer reads per day.
+
+        Args:
+            enabled (bool, optional): If True, profile subsequent days. Default is True.
+        """
+        self._profiling = enabled
+
+    def _record_profile(self, path: str, orders, file_mb: float, ingest_s: float, run_s: float):
+        previous = self._profile_records[-1] if self._profile_records else None
+        log_sizes = self._sim_cpp.getLogSizes()
+        # only scan the order records added since the previous day
+        first = {name: previous[f"{name}_total"] if previous else 0
+                 for name in ("accepted_orders", "executed_orders", "killed_orders")}
+        previous_runs = previous["dp_runs_total"] if previous else 0
+        dp_runs = max(previous_runs, self._sim_cpp.getMaxDpRunFrom(first["accepted_orders"], first["executed_orders"],
+                                                                   first["killed_orders"]))
+        dp_solves = dp_runs - previous_runs
+        peak_rss_mb = np.nan
+        if resource is not None:
+            # ru_maxrss is in kB on Linux and in bytes on macOS
+            scale = 1024**2 if sys.platform == "darwin" else 1024
+            peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+        record = {
+            "file": os.path.basename(path),
+            "file_mb": file_mb,
+            "orders": orders if orders is not None else np.nan,
+            "orders_per_s": orders / (ingest_s + run_s) if orders is not None else np.nan,
+            "ingest_s": ingest_s,
+            "run_s": run_s,
+            "dp_solves_with_orders": dp_solves,
+            "run_s_per_dp_solve": run_s / dp_solves if dp_solves > 0 else np.nan,
+            "dp_runs_total": dp_runs,
+            "peak_rss_mb": peak_rss_mb,
+        }
+        for name, size in log_sizes.items():
+            record[f"new_{name}"] = size - (previous[f"{name}_total"] if previous else 0)
+            record[f"{name}_total"] = size
+        self._profile_records.append(record)
+
+    def get_profile(self):
+        """
+        Retrieve the per-day profiling data collected by `run` (see `enable_profiling`).
+
+        Returns:
+            pd.DataFrame: One row per simulated day file with the columns:
+                - file: The order binary of the day.
+                - file_mb: Size of the loaded order binaries of the day (MB).
+                - orders: Number of orders in the file (from the catalog, NaN without one).
+                - orders_per_s: Orders processed per second of ingestion and run time.
+                - ingest_s: Wall time of loading the file into the order queue (s).
+                - run_s: Wall time of the engine run over the day, including matching and DP solves (s).
+                - dp_solves_with_orders: Number of DP solves during the day, derived from the DP run ids of the
+                  logged orders. Solves after the last one of the day that logged an order are only counted on
+                  the day of the next logged order (or not at all after the last one of the run).
+                - run_s_per_dp_solve: Engine run time per counted DP solve, an upper bound on the mean solve time
+                  (s), NaN on days without counted solves.
+                - dp_runs_total: Highest DP run id logged so far, i.e. the cumulative number of counted DP solves.
+                - peak_rss_mb: Peak resident memory of the process so far (MB, NaN on Windows).
+                - new_<log> / <log>_total: Records added to each log during the day / in total.
+        """
+        return pd.DataFrame(self._profile_records)
+
+    def get_profile_summary(self):
+        """
+        Retrieve cumulative profiling statistics over all profiled days.
+
+        Returns:
+            dict: Totals and statistics of the per-day profile, including the total ingestion, run
+                and log retrieval times, the number of DP solves counted from the logged orders (see
+                `get_profile`), the mean and 99th percentile of the per-day run time per DP solve, and the peak
+                resident memory.
+        """
+        profile = self.get_profile()
+        if profile.empty:
+            return {}
+        per_solve = profile["run_s_per_dp_solve"].dropna()
+        dp_solves = int(profile["dp_solves_with_orders"].sum())
+        return {
+            "days": len(profile),
+            "ingest_s": float(profile["ingest_s"].sum()),
+            "run_s": float(profile["run_s"].sum()),
+            "get_logs_s": self._profile_get_logs_s,
+            "dp_solves_with_orders": dp_solves,
+            "mean_run_s_per_dp_solve": float(profile["run_s"].sum() / max(dp_solves, 1)),
+            "p99_day_run_s_per_dp_solve": float(per_solve.quantile(0.99)) if not per_solve.empty else np.nan,
+            "max_day_run_s": float(profile["run_s"].max()),
+            "peak_rss_mb": float(profile["peak_rss_mb"].max()),
+        }
     
     def print_parameters(self):
         """
@@ -404,4 +885,132 @@ class Simulation:
             vol_price_list["current_time"] = pd.to_datetime(vol_price_list["current_time"], utc=True)
             vol_price_list["delivery_hour"] = pd.to_datetime(vol_price_list["delivery_hour"], utc=True)
             
-        return vol_price_list
\ No newline at end of file
+        return vol_price_list
+
+    def return_depth_tensor(self, is_last: bool, frequency: int, volumes: np.ndarray):
+        """
+        Sample the order book depth of all open delivery hours as dense NumPy arrays.
+
+        Runs the same market replay as `return_vol_price_pairs` and returns its results as arrays instead of
+        one Python dict per sample. Negative volumes are sell volumes (priced against the bid side), positive
+        volumes buy volumes (ask side); zero volumes are ignored.
+
+        Args:
+            is_last (bool): If True, indicates this is the last iteration of data.
+            frequency (int): The frequency (in seconds) at which the order book is sampled.
+            volumes (np.ndarray): A 1D numpy array of integer volumes, passed to the engine as by
+                `return_vol_price_pairs`.
+
+        Returns:
+            dict: With the entries:
+                - current_time (pd.DatetimeIndex): Sample times (UTC), length T.
+                - delivery_hour (pd.DatetimeIndex): Delivery hours (UTC), length D.
+                - levels (np.ndarray): The absolute volume levels returned by the engine, ascending, length L,
+                  in the units of the volume column of `return_vol_price_pairs` (MWh).
+                - sides (list): ["bid", "ask"], i.e. selling and buying the level volume.
+                - price_full (np.ndarray): Full price (cashflow) of each level (€), shape (T, D, L, 2).
+                - worst_accepted_price (np.ndarray): Market price of the worst matched order (€/MWh), shape (T, D, L, 2).
+                Entries are NaN where a delivery hour is not open or a level was not sampled.
+        """
+        volumes = np.asarray(volumes)
+        if len(volumes.shape) != 1:
+            raise ValueError("volumes must be a 1D numpy array")
+        if frequency <= 0:
+            raise ValueError("frequency must be > 0")
+        if not np.all(np.mod(volumes, 1) == 0):
+            raise ValueError("volumes must be integers")
+        volumes = np.unique(volumes[volumes != 0]).astype(int)
+
+        times, hours, keys, price_full, worst_price = self._sim_cpp.return_vol_price_arrays(is_last, frequency,
+                                                                                           volumes.tolist())
+        keys = np.asarray(keys)
+        if np.any(keys == 0):
+            raise ValueError("The engine returned prices for a zero volume")
+        levels = np.unique(np.abs(keys))
+        side = (keys > 0).astype(int)
+        level = np.searchsorted(levels, np.abs(keys))
+        shape = (len(times), len(hours), len(levels), 2)
+        full_tensor = np.full(shape, np.nan)
+        worst_tensor = np.full(shape, np.nan)
+        full_tensor[:, :, level, side] = price_full
+        worst_tensor[:, :, level, side] = worst_price
+
+        return {
+            "current_time": pd.to_datetime(pd.Index(times), utc=True),
+            "delivery_hour": pd.to_datetime(pd.Index(hours), utc=True),
+            # same conversion of the engine's volume keys as in return_vol_price_pairs
+            "levels": levels / 10.0,
+            "sides": ["bid", "ask"],
+            "price_full": full_tensor,
+            "worst_accepted_price": worst_tensor,
+        }
+
+
+# approximate engine sizes of an order and of a record of each log (number of fields x 8 bytes)
+_ORDER_BYTES = 64
+_LOG_RECORD_BYTES = {
+    "decision_record": 48,
+    "price_record": 72,
+    "accepted_orders": 112,
+    "executed_orders": 96,
+    "forecast_orders": 64,
+    "killed_orders": 96,
+    "balancing_orders": 96,
+}
+
+
+def _queue_mb(parts: list):
+    """Estimated size of the order queue filled from the files of a plan (MB)."""
+    total = 0.
+    for path, entry in parts:
+        if path.endswith(COMPRESSED_SUFFIX):
+            orders = entry["orders"] if entry is not None else read_compressed_header(path)[0]["orders"]
+            total += orders * _ORDER_BYTES
+        else:
+            total += os.path.getsize(path)
+    return total / 1024**2
+
+
+def _current_rss_mb():
+    """Resident memory of the process (MB), read from /proc, NaN where it is not available."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return np.nan
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / 1024**2
+
+
+def _storage_before(decision_record: pd.DataFrame, boundary: pd.Timestamp):
+    """Storage level (MWh) of the last delivery hour before boundary, NaN if there is none."""
+    if decision_record.empty:
+        return np.nan
+    before = decision_record[decision_record["hour"] < boundary]
+    return float(before["storage"].iloc[-1]) if not before.empty else np.nan
+
+
+def _run_window(data_path: str, kwargs: dict, warmup_start: pd.Timestamp, start: pd.Timestamp, end: pd.Timestamp):
+    """
+    Simulate [warmup_start, end) and keep the logs of the delivery hours in [start, end), for `run_parallel`.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):  # keep the output of parallel runs from interleaving
+        sim = Simulation(warmup_start, end, **kwargs)
+        t_start = time.perf_counter()
+        sim.run(data_path, verbose=False)
+        run_s = time.perf_counter() - t_start
+    logs = sim.get_logs()
+    delivery_columns = {"decision_record": "hour", "price_record": "hour", "accepted_orders": "delivery",
+                        "executed_orders": "hour", "killed_orders": "hour"}
+    stitched = {}
+    for key, df in logs.items():
+        column = delivery_columns.get(key)
+        if column is not None and not df.empty:
+            df = df[(df[column] >= start) & (df[column] < end)].reset_index(drop=True)
+        stitched[key] = df
+    return {
+        "logs": stitched,
+        "reward": float(Results(stitched).get_total_reward()),
+        "start_storage": _storage_before(logs["decision_record"], start),
+        "end_storage": _storage_before(logs["decision_record"], end),
+        "run_s": run_s,
+    }
@@ -0,0 +1,123 @@
+######################################################################
+# Copyright (C) 2025 ETH Zurich
+# BitePy: A Python Battery Intraday Trading Engine
+# Bits to Energy Lab - Chair of Information Management - ETH Zurich
+#
+# Author: David Schaurecker
+#
+# Licensed under MIT License, see https://opensource.org/license/mit
+######################################################################
+
+import json
+import os
+import tempfile
+
+from .catalog import _sha256
+
+STATE_VERSION = 1
+
+
+class ProcessingState:
+    def __init__(self, path: str, file_name: str):
+        """
+        Initialize an (empty) record of which outputs in a directory were produced from which sources.
+
+        For every output (e.g. one parsed day), the state stores the fingerprints (size, modification
+        time and SHA-256) of the source files it was produced from, the version of the processing, and
+        the sizes of the written files. `Data` uses it to skip days whose outputs are up to date.
+
+        Args:
+            path (str): The output directory.
+            file_name (str): Name of the state file in the output directory.
+        """
+        self.path = path
+        self.file_name = file_name
+        self.outputs = {}
+        self._fingerprints = {}
+
+    @classmethod
+    def load(cls, path: str, file_name: str):
+        """Load the state file of a directory, or return an empty state if it does not exist."""
+        state = cls(path, file_name)
+        state_path = os.path.join(path, file_name)
+        if os.path.exists(state_path):
+            with open(state_path, "r") as f:
+                content = json.load(f)
+            if content.get("version") == STATE_VERSION:
+                state.outputs = content["outputs"]
+        return state
+
+    def save(self):
+        """Write the state atomically to the state file."""
+        os.makedirs(self.path, exist_ok=True)
+        content = {"version": STATE_VERSION, "outputs": dict(sorted(self.outputs.items()))}
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix=".state-", suffix=".json")
+        with os.fdopen(fd, "w") as f:
+            json.dump(content, f, indent=1)
+        os.replace(tmp_path, os.path.join(self.path, self.file_name))
+
+    def fingerprint(self, file_path: str):
+        """
+        Return the fingerprint of a source file.
+
+        The checksum is only recomputed if the size or modification time differ from the recorded
+        fingerprint, so checking unchanged sources is cheap. Fingerprints are cached per instance.
+        """
+        file_path = os.path.abspath(file_path)
+        if file_path in self._fingerprints:
+            return self._fingerprints[file_path]
+        stat = os.stat(file_path)
+        fingerprint = {"path": file_path, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": None}
+        for output in self.outputs.values():
+            for known in output["sources"]:
+                if (known["path"] == file_path and known["size"] == stat.st_size
+                        and known["mtime_ns"] == stat.st_mtime_ns):
+                    fingerprint["sha256"] = known["sha256"]
+                    break
+            if fingerprint["sha256"] is not None:
+                break
+        if fingerprint["sha256"] is None:
+            fingerprint["sha256"] = _sha256(file_path)
+        self._fingerprints[file_path] = fingerprint
+        return fingerprint
+
+    def is_up_to_date(self, key: str, sources: list, version: str):
+        """
+        Whether an output was produced from the current content of sources with this processing version.
+
+        Args:
+            key (str): Name of the output, e.g. the output file name of a day.
+            sources (list): Paths of the source files the output depends on, in a fixed order.
+            version (str): Identifier of the processing (format version and options).
+
+        Returns:
+            bool: False if the output is unknown, was produced by another version or from other sources,
+                a source's content changed, or a written file is missing or has another size.
+        """
+        output = self.outputs.get(key)
+        if output is None or output["version"] != version or len(output["sources"]) != len(sources):
+            return False
+        for known, source in zip(output["sources"], sources):
+            if known["path"] != os.path.abspath(source) or known["sha256"] != self.fingerprint(source)["sha256"]:
+                return False
+        for name, size in output["files"].items():
+            file_path = os.path.join(self.path, name)
+            if not os.path.exists(file_path) or os.path.getsize(file_path) != size:
+                return False
+        return True
+
+    def record(self, key: str, sources: list, version: str, files: list):
+        """
+        Record that an output was (re)produced.
+
+        Args:
+            key (str): Name of the output.
+            sources (list): Paths of the source files the output depends on, in a fixed order.
+            version (str): Identifier of the processing.
+            files (list): Paths of the written files, inside the output directory.
+        """
+        self.outputs[key] = {
+            "version": version,
+            "sources": [self.fingerprint(source) for source in sources],
+            "files": {os.path.basename(p): os.path.getsize(p) for p in files},
+        }
@@ -0,0 +1,189 @@
+######################################################################
+# Copyright (C) 2025 ETH Zurich
+# BitePy: A Python Battery Intraday Trading Engine
+# Bits to Energy Lab - Chair of Information Management - ETH Zurich
+#
+# Author: David Schaurecker
+#
+# Licensed under MIT License, see https://opensource.org/license/mit
+######################################################################
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from .data import Data, _order_columns
+
+_STAGES = ("ingest", "run", "decisions", "total")
+
+
+class OrderStream:
+    def __init__(self, simulation):
+        """
+        Initialize a push-based order feed for a simulation.
+
+        Orders are pushed in small batches; each batch is added to the engine's order queue and simulated
+        right away, and the orders the battery sent in response are returned. The latency of every push
+        is recorded per stage (ingestion, engine run, conversion of the decisions).
+
+        Pushes are serialized with the async methods of the simulation (see `Simulation.run_days_async`),
+        so a batch is never added to the order queue while the engine runs a day for another caller.
+
+        Args:
+            simulation (Simulation): The simulation to feed, with its window covering the streamed orders.
+                Do not run it otherwise while streaming.
+        """
+        self.simulation = simulation
+        self._executed = 0
+        self._latencies = {stage: [] for stage in _STAGES}
+        self._batch_sizes = []
+        self.closed = False
+
+    def push(self, orders):
+        """
+        Add a batch of orders and simulate it.
+
+        Args:
+            orders (pd.DataFrame or tuple): The orders, either as a DataFrame with the columns of the
+                pre-processed CSV files (timestamps as ISO 8601 strings in UTC, or as timezone aware
+                datetimes), or as the tuple of column lists ids, initials, sides, starts, transactions,
+                validities, prices, quantities. Batches must be pushed in transaction-time order.
+
+        Returns:
+            pd.DataFrame: The orders executed by the battery while simulating the batch, with the columns
+                of the executed_orders log (see `Simulation.get_logs`).
+        """
+        if self.closed:
+            raise ValueError("The order stream is closed")
+        t_start = time.perf_counter()
+        columns = _order_columns(orders) if isinstance(orders, pd.DataFrame) else orders
+        with self.simulation._engine_calls:
+            self.simulation._add_order_columns(columns)
+            t_ingested = time.perf_counter()
+            self.simulation.run_one_day(False)
+            t_run = time.perf_counter()
+            decisions = self._new_decisions()
+        t_end = time.perf_counter()
+        self._record(len(columns[0]), t_start, t_ingested, t_run, t_end)
+        return decisions
+
+    def close(self):
+        """
+        Finish the simulation after the last batch.
+
+        Returns:
+            pd.DataFrame: The orders executed by the battery when finalizing the simulation.
+        """
+        if self.closed:
+            raise ValueError("The order stream is closed")
+        with self.simulation._engine_calls:
+            self.simulation.run_one_day(True)
+            self.closed = True
+            return self._new_decisions()
+
+    def replay(self, file_path: str, batch_orders: int = 100, speed: float = None):
+        """
+        Replay an order file through `push`, as a local stand-in for a live feed.
+
+        Args:
+            file_path (str): A zipped CSV file of pre-processed orders (see `Data.parse_market_data`) or a
+                block-compressed order file (.zbin).
+            batch_orders (int, optional): Number of orders per pushed batch. Default is 100.
+            speed (float, optional): If given, batches are paced by their transaction times, sped up by this
+                factor (1 is real time). Default is None (as fast as possible).
+
+        Yields:
+            tuple: (batch index, DataFrame of the orders executed by the battery in response to the batch).
+        """
+        if batch_orders <= 0:
+            raise ValueError("batch_orders must be > 0")
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be > 0")
+        columns = Data().load_orders(file_path)
+
+        num_orders = len(columns[0])
+        transactions = pd.to_datetime(pd.Series(columns[4]), utc=True)
+        t_wall = time.perf_counter()
+        for i, lo in enumerate(range(0, num_orders, batch_orders)):
+            hi = min(lo + batch_orders, num_orders)
+            if speed is not None:
+                due = (transactions[lo] - transactions[0]).total_seconds() / speed
+                delay = due - (time.perf_counter() - t_wall)
+                if delay > 0:
+                    time.sleep(delay)
+            yield i, self.push(tuple(col[lo:hi] for col in columns))
+
+    def _new_decisions(self):
+        records = self.simulation._sim_cpp.getExecutedOrdersFrom(self._executed)
+        self._executed += len(records)
+        decisions = pd.DataFrame(records)
+        if not decisions.empty:
+            decisions["time"] = pd.to_datetime(decisions["time"], utc=True)
+            decisions["last_solve_time"] = pd.to_datetime(decisions["last_solve_time"], utc=True)
+            decisions["hour"] = pd.to_datetime(decisions["hour"], utc=True)
+        return decisions
+
+    def _record(self, num_orders: int, t_start: float, t_ingested: float, t_run: float, t_end: float):
+        self._batch_sizes.append(num_orders)
+        self._latencies["ingest"].append(t_ingested - t_start)
+        self._latencies["run"].append(t_run - t_ingested)
+        self._latencies["decisions"].append(t_end - t_run)
+        self._latencies["total"].append(t_end - t_start)
+
+    def get_latencies(self):
+        """
+        Retrieve the latency of every push.
+
+        Returns:
+            pd.DataFrame: One row per pushed batch with the number of orders and the wall time (ms) of the
+                stages ingest (adding to the order queue), run (engine), decisions (converting the executed
+                orders) and total.
+        """
+        latencies = pd.DataFrame({f"{stage}_ms": np.asarray(values) * 1000. for stage, values in self._latencies.items()})
+        latencies.insert(0, "orders", self._batch_sizes)
+        return latencies
+
+    def latency_histogram(self, bins: int = 30):
+        """
+        Histogram of the push latencies per stage, on logarithmically spaced bins.
+
+        Args:
+            bins (int, optional): Number of bins. Default is 30.
+
+        Returns:
+            pd.DataFrame: One row per bin with its edges (low_ms, high_ms) and the number of pushes per stage
+                (ingest, run, decisions, total) whose latency falls into it.
+        """
+        latencies = self.get_latencies()
+        if latencies.empty:
+            return pd.DataFrame(columns=["low_ms", "high_ms", *_STAGES])
+        values = latencies[[f"{stage}_ms" for stage in _STAGES]].to_numpy()
+        positive = values[values > 0]
+        low = positive.min() if positive.size else 1e-3
+        high = max(values.max(), low * 10)
+        edges = np.geomspace(low, high, bins + 1)
+        histogram = pd.DataFrame({"low_ms": edges[:-1], "high_ms": edges[1:]})
+        for stage in _STAGES:
+            # latencies below the first edge (e.g. zero) are counted in the first bin
+            stage_values = np.clip(latencies[f"{stage}_ms"].to_numpy(), low, high)
+            histogram[stage] = np.histogram(stage_values, bins=edges)[0]
+        return histogram
+
+    def get_latency_summary(self):
+        """
+        Summarize the push latencies.
+
+        Returns:
+            dict: The number of batches and orders, and per stage the median, 99th percentile and maximum
+                latency (ms), e.g. total_p50_ms.
+        """
+        latencies = self.get_latencies()
+        summary = {"batches": len(latencies), "orders": int(latencies["orders"].sum()) if len(latencies) else 0}
+        for stage in _STAGES:
+            values = latencies[f"{stage}_ms"]
+            summary[f"{stage}_p50_ms"] = float(values.quantile(0.5)) if len(values) else np.nan
+            summary[f"{stage}_p99_ms"] = float(values.quantile(0.99)) if len(values) else np.nan
+            summary[f"{stage}_max_ms"] = float(values.max()) if len(values) else np.nan
+        return summary
+
@@ -0,0 +1,50 @@
+######################################################################
+# Copyright (C) 2025 ETH Zurich
+# BitePy: A Python Battery Intraday Trading Engine
+# Bits to Energy Lab - Chair of Information Management - ETH Zurich
+#
+# Author: David Schaurecker
+#
+# Licensed under MIT License, see https://opensource.org/license/mit
+######################################################################
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bitepy.compression import read_compressed_header, read_compressed_orders, write_compressed_orders
+
+_MODULES = {"zstd": "zstandard", "lz4": "lz4.frame", "zlib": "zlib"}
+
+
+def _orders(num_orders: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    transaction = pd.Timestamp("2021-01-01", tz="UTC") + pd.to_timedelta(
+        np.sort(rng.integers(0, 86_400_000, num_orders)), unit="ms")
+    validity = transaction + pd.to_timedelta(rng.integers(1, 3_600_000, num_orders), unit="ms")
+    start = (transaction + pd.Timedelta(hours=2)).floor("h")
+    ms = "%Y-%m-%dT%H:%M:%S.%f"
+    return (
+        np.arange(num_orders, dtype=np.int64).tolist(),
+        rng.integers(0, num_orders, num_orders).tolist(),
+        np.where(rng.random(num_orders) < 0.5, "BUY", "SELL").tolist(),
+        start.strftime("%Y-%m-%dT%H:%M:%SZ").tolist(),
+        (transaction.strftime(ms).str[:-3] + "Z").tolist(),
+        (validity.strftime(ms).str[:-3] + "Z").tolist(),
+        np.round(rng.normal(50., 20., num_orders), 2).tolist(),
+        np.round(rng.lognormal(1., 0.8, num_orders), 1).tolist(),
+    )
+
+
+@pytest.mark.parametrize("codec", ["zstd", "lz4", "zlib"])
+def test_multi_block_multi_thread_round_trip(tmp_path, codec):
+    pytest.importorskip(_MODULES[codec])
+    columns = _orders(50_000)
+    path = str(tmp_path / "orders.zbin")
+
+    write_compressed_orders(path, columns, codec=codec, block_orders=1_000, threads=8)
+    header, _ = read_compressed_header(path)
+    assert header["codec"] == codec and len(header["blocks"]) == 50
+
+    for written, read in zip(columns, read_compressed_orders(path, threads=8)):
+        assert list(read) == written
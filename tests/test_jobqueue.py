@@ -0,0 +1,109 @@
+######################################################################
+# Copyright (C) 2025 ETH Zurich
+# BitePy: A Python Battery Intraday Trading Engine
+# Bits to Energy Lab - Chair of Information Management - ETH Zurich
+#
+# Author: David Schaurecker
+#
+# Licensed under MIT License, see https://opensource.org/license/mit
+######################################################################
+
+import os
+import time
+
+from bitepy.jobqueue import JobQueue
+
+STALE_S = 60.
+
+
+def _age(path: str, seconds: float):
+    """Set the modification time of a file seconds into the past."""
+    t = time.time() - seconds
+    os.utime(path, (t, t))
+
+
+def _running_path(queue: JobQueue, job: dict):
+    return os.path.join(queue.path, "running", f"{job['id']}.json")
+
+
+def test_complete_after_stale_requeue_keeps_job_in_one_state(tmp_path):
+    queue = JobQueue(str(tmp_path))
+    queue.submit({"x": 1}, job_id="a")
+    job = queue.claim("w1")
+    _age(_running_path(queue, job), 2 * STALE_S)
+    assert queue.requeue_stale(STALE_S) == ["a"]
+
+    assert not queue.complete(job, {"reward": 1., "logs": {"x": 1}})
+    assert queue.status() == {"pending": 1, "running": 0, "done": 0, "failed": 0}
+    assert queue.results().empty
+    assert not [f for f in os.listdir(os.path.join(queue.path, "results")) if not f.startswith(".submit-")]
+
+    job = queue.claim("w2")
+    queue.complete(job, {"reward": 1.})
+    assert queue.status() == {"pending": 0, "running": 0, "done": 1, "failed": 0}
+
+
+def test_stale_worker_does_not_move_job_claimed_again(tmp_path):
+    queue = JobQueue(str(tmp_path))
+    queue.submit({"x": 1}, job_id="a")
+    first = queue.claim("w1")
+    _age(_running_path(queue, first), 2 * STALE_S)
+    queue.requeue_stale(STALE_S)
+    second = queue.claim("w2")
+
+    assert not queue.heartbeat(first)
+    assert not queue.fail(first, "late failure of the stale worker")
+    assert not queue.complete(first, {"reward": 1.})
+    assert queue.status() == {"pending": 0, "running": 1, "done": 0, "failed": 0}
+    assert queue.results().empty
+    assert queue.heartbeat(second)
+
+    assert queue.complete(second, {"reward": 2.})
+    assert queue.status() == {"pending": 0, "running": 0, "done": 1, "failed": 0}
+    assert queue.results().loc["a", "worker"] == "w2"
+    assert queue.results().loc["a", "reward"] == 2.
+
+
+def test_requeue_recovers_job_of_worker_that_died_while_claiming(tmp_path):
+    queue = JobQueue(str(tmp_path))
+    queue.submit({"x": 1}, job_id="a")
+    claim_path = queue._private_path("claim")
+    os.rename(os.path.join(queue.path, "pending", "a.json"), claim_path)
+    assert queue.requeue_stale(STALE_S) == []
+
+    _age(claim_path, 2 * STALE_S)
+    assert queue.requeue_stale(STALE_S) == ["a"]
+    assert queue.status() == {"pending": 1, "running": 0, "done": 0, "failed": 0}
+    assert queue.claim("w1")["id"] == "a"
+
+
+def test_claim_of_long_pending_job_is_not_stale(tmp_path):
+    queue = JobQueue(str(tmp_path))
+    queue.submit({"x": 1}, job_id="a")
+    _age(os.path.join(queue.path, "pending", "a.json"), 2 * STALE_S)
+
+    job = queue.claim("w1")
+    assert queue.requeue_stale(STALE_S) == []
+    queue.complete(job, {"reward": 1.})
+    assert queue.status() == {"pending": 0, "running": 0, "done": 1, "failed": 0}
+
+
+def test_requeue_racing_claim_and_complete(tmp_path):
+    queue = JobQueue(str(tmp_path))
+    for i in range(20):
+        queue.submit({"x": i}, job_id=f"job{i}")
+    # every claimed job is immediately stale for the other worker
+    other = JobQueue(str(tmp_path))
+    while True:
+        job = queue.claim("w1")
+        if job is None:
+            break
+        _age(_running_path(queue, job), 2 * STALE_S)
+        if job["attempts"] == 1 and int(job["id"][3:]) % 2:
+            other.requeue_stale(STALE_S)
+        queue.complete(job, {"reward": 1.})
+        counts = queue.status()
+        assert sum(counts.values()) == 20
+
+    assert queue.status() == {"pending": 0, "running": 0, "done": 20, "failed": 0}
+    assert os.listdir(os.path.join(queue.path, "running")) == []
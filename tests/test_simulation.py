@@ -0,0 +1,114 @@
+######################################################################
+# Copyright (C) 2025 ETH Zurich
+# BitePy: A Python Battery Intraday Trading Engine
+# Bits to Energy Lab - Chair of Information Management - ETH Zurich
+#
+# Author: David Schaurecker
+#
+# Licensed under MIT License, see https://opensource.org/license/mit
+######################################################################
+
+import asyncio
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import bitepy as bp
+from bitepy.latency import QUANTILE_LEVELS
+
+DAY = pd.Timestamp("2021-01-01", tz="UTC")
+
+
+@pytest.fixture(scope="module")
+def bin_path(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("bins"))
+    bp.Data().create_synthetic_bins("2021-01-01", "2021-01-03", path, orders_per_day=5_000, seed=1, verbose=False)
+    return path
+
+
+def _replay(bin_path: str):
+    sim = bp.Simulation(DAY, DAY + pd.Timedelta(days=1))
+    sim.add_bin_to_orderqueue(os.path.join(bin_path, "orderbook_2021-01-01.bin"))
+    return sim
+
+
+def test_depth_tensor_matches_vol_price_pairs(bin_path):
+    volumes = np.array([-20, -10, 10, 20])
+    pairs = _replay(bin_path).return_vol_price_pairs(True, 3600, volumes)
+    tensor = _replay(bin_path).return_depth_tensor(True, 3600, volumes)
+    assert not pairs.empty
+
+    t = tensor["current_time"].get_indexer(pairs["current_time"])
+    d = tensor["delivery_hour"].get_indexer(pairs["delivery_hour"])
+    level = np.searchsorted(tensor["levels"], pairs["volume"].abs().to_numpy())
+    side = (pairs["volume"] > 0).to_numpy().astype(int)
+    assert (t >= 0).all() and (d >= 0).all()
+    np.testing.assert_allclose(tensor["levels"][level], pairs["volume"].abs())
+    np.testing.assert_allclose(tensor["price_full"][t, d, level, side], pairs["price_full"])
+    np.testing.assert_allclose(tensor["worst_accepted_price"][t, d, level, side], pairs["worst_accepted_price"])
+    assert np.count_nonzero(~np.isnan(tensor["price_full"])) == len(pairs)
+
+
+def test_depth_tensor_rejects_fractional_volumes(bin_path):
+    with pytest.raises(ValueError):
+        _replay(bin_path).return_depth_tensor(True, 3600, np.array([-0.5, 1.5]))
+
+
+def test_run_days_async_releases_engine_when_iteration_stops(bin_path):
+    async def main():
+        sim = bp.Simulation(DAY, DAY + pd.Timedelta(days=1))
+        days = sim.run_days_async(bin_path)
+        progress = await days.__anext__()
+        # the consumer stopped iterating, but the generator is neither closed nor collected yet
+        logs = await asyncio.wait_for(sim.get_logs_async(), timeout=30)
+        await days.aclose()
+        return progress, logs
+
+    progress, logs = asyncio.run(main())
+    assert progress["day_index"] == 0
+    assert "decision_record" in logs
+
+
+def test_run_restores_fixed_solve_time_after_latency_model(bin_path):
+    sim = bp.Simulation(DAY, DAY + pd.Timedelta(days=1), fixed_solve_time=3)
+    model = bp.SolveLatencyModel()
+    model.quantiles[str(sim._sim_cpp.params.numStorStates)] = [25.] * len(QUANTILE_LEVELS)
+    model.samples[str(sim._sim_cpp.params.numStorStates)] = 100
+    sim.run(bin_path, verbose=False, solve_latency_model=model)
+    assert sim._sim_cpp.params.fixedSolveTime == 3
+
+
+def test_run_finalizes_engine_when_callback_stops(bin_path, monkeypatch):
+    sim = bp.Simulation(DAY, DAY + pd.Timedelta(days=2))
+    calls = []
+    run_one_day = sim.run_one_day
+    monkeypatch.setattr(sim, "run_one_day", lambda is_last: calls.append(is_last) or run_one_day(is_last))
+    sim.run(bin_path, verbose=False, progress_callback=lambda progress: False, callback_interval_s=None)
+    assert calls == [False, True]
+
+
+def test_run_parallel_is_silent_without_verbose(bin_path, capsys):
+    sim = bp.Simulation(DAY, DAY + pd.Timedelta(days=2))
+    report = sim.run_parallel(bin_path, chunk_days=1, workers=2, verbose=False)
+    assert len(report["chunks"]) == 2
+    assert capsys.readouterr().out == ""
+
+
+def test_order_stream_waits_for_engine_calls(tmp_path):
+    bp.Data().create_synthetic_bins("2021-01-01", "2021-01-01", str(tmp_path), orders_per_day=200, seed=2,
+                                    verbose=False, compression="zlib")
+    columns = bp.Data().load_orders(str(next(tmp_path.glob("*.zbin"))))
+    sim = bp.Simulation(DAY, DAY + pd.Timedelta(days=1))
+    stream = sim.open_stream()
+    pushed = threading.Event()
+    with sim._engine_calls:
+        thread = threading.Thread(target=lambda: stream.push(columns) is not None and pushed.set())
+        thread.start()
+        assert not pushed.wait(0.5)
+    thread.join(timeout=30)
+    assert pushed.is_set()
+    assert sim._queued_mb == 0.
+    stream.close()